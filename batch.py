@@ -0,0 +1,140 @@
+import itertools
+import math
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from records import RecordStore
+
+# Batches smaller than this are validated in process, pool startup and pickling would cost more than they save
+PARALLEL_MIN_ROWS = 10_000
+CHUNKS_PER_WORKER = 4
+MIN_CHUNK_SIZE = 1_000
+MAX_CHUNK_SIZE = 50_000
+
+
+class RowError(NamedTuple):
+    """Error of a single field of a row, error message is formatted only when message is read."""
+    row: int
+    field: str
+    error: Exception
+
+    @property
+    def message(self) -> str:
+        return self.error.args[0]
+
+
+@dataclass
+class BatchResult:
+    """
+    Result of NonBlockingValidationDataclass.from_dicts:
+    instances - valid instances in input order, records.RecordStore if requested by as_records
+    rows      - input row number of every valid instance
+    errors    - flat list of RowError(row, field, error) of invalid rows
+    """
+    instances: List[Any] = field(default_factory=list)
+    rows: List[int] = field(default_factory=list)
+    errors: List[RowError] = field(default_factory=list)
+
+    def add_instance(self, row: int, instance):
+        self.instances.append(instance)
+        self.rows.append(row)
+
+    def add_record(self, row: int, node_values: list):
+        """Valid record appended to RecordStore instances as validated values of every node of the plan."""
+        self.instances.append_node_values(node_values)
+        self.rows.append(row)
+
+    def add_errors(self, row: int, errors: list):
+        """errors - list of (field name, error) pairs of a single row"""
+        self.errors.extend(RowError(row, field_name, error) for field_name, error in errors)
+
+    def extend(self, other: 'BatchResult'):
+        self.instances.extend(other.instances)
+        self.rows.extend(other.rows)
+        self.errors.extend(other.errors)
+
+    @property
+    def invalid_rows(self) -> List[int]:
+        return list(dict.fromkeys(error.row for error in self.errors))
+
+    def errors_by_row(self) -> Dict[int, Dict[str, List[str]]]:
+        """{row: {field: [message, ...]}}"""
+        errors_by_row = {}
+        for error in self.errors:
+            errors_by_row.setdefault(error.row, {}).setdefault(error.field, []).append(error.message)
+        return errors_by_row
+
+
+def get_chunk_size(total_rows: int, workers: int) -> int:
+    """Few chunks per worker to balance uneven chunks, bounded to keep pickling overhead and memory per chunk sane."""
+    return min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, math.ceil(total_rows / (workers * CHUNKS_PER_WORKER))))
+
+
+def validate_chunk(cls, dicts_data: Iterable[dict], first_row: int = 0, as_records: bool = False) -> BatchResult:
+    """
+    Validate records in process, rows are numbered from first_row.
+    Module level function so process pool workers can run it, cls is pickled by reference and its validation plan
+    is built once per worker process.
+    as_records keeps valid records in a RecordStore instead of building an instance for every record.
+    """
+    plan = cls._get_validation_plan()
+
+    if as_records:
+        result = BatchResult(instances=RecordStore(cls))
+        for row, dict_data in enumerate(dicts_data, first_row):
+            node_values, errors = plan.run_values(dict_data)
+            if errors:
+                result.add_errors(row, errors)
+            else:
+                result.add_record(row, node_values)
+        return result
+
+    result = BatchResult()
+    for row, dict_data in enumerate(dicts_data, first_row):
+        instance, errors = plan.run(dict_data)
+        if errors:
+            result.add_errors(row, errors)
+        else:
+            result.add_instance(row, instance)
+
+    return result
+
+
+def validate_parallel(cls, dicts_data: Iterable[dict], workers: int, chunk_size: Optional[int] = None,
+                      executor: Optional[Executor] = None, as_records: bool = False) -> BatchResult:
+    """
+    Validate records in chunks on a process pool, results and errors are merged in input order.
+    Only a bounded number of chunks is in flight, so lazy iterables are not materialized as a whole.
+    cls must be importable by workers (declared at module level).
+    """
+    total_rows = len(dicts_data) if hasattr(dicts_data, '__len__') else None
+    if total_rows is not None and total_rows < PARALLEL_MIN_ROWS:
+        return validate_chunk(cls, dicts_data, as_records=as_records)
+    if chunk_size is None:
+        chunk_size = get_chunk_size(total_rows or PARALLEL_MIN_ROWS * workers, workers)
+
+    iterator = iter(dicts_data)
+    first_chunk = list(itertools.islice(iterator, chunk_size))
+    if len(first_chunk) < chunk_size:
+        return validate_chunk(cls, first_chunk, as_records=as_records)
+
+    chunks = itertools.chain([first_chunk], iter(lambda: list(itertools.islice(iterator, chunk_size)), []))
+    result = BatchResult(instances=RecordStore(cls)) if as_records else BatchResult()
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        first_row = 0
+        for chunk in chunks:
+            pending.append(pool.submit(validate_chunk, cls, chunk, first_row, as_records))
+            first_row += len(chunk)
+            if len(pending) >= workers * 2:
+                result.extend(pending.popleft().result())
+        while pending:
+            result.extend(pending.popleft().result())
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+
+    return result
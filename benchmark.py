@@ -0,0 +1,368 @@
+"""
+Benchmark suite of from_dict / as_dict / JSON export / batch / streaming validation on synthetic schemas.
+
+Schemas are generated with configurable width (fields per dataclass), nesting depth, validator mix and ratio of
+invalid rows. Every scenario reports ops/s and peak memory (tracemalloc), scenarios of single operations p50 / p99
+latency of single calls as well. Results are written as JSON and can be compared against a stored baseline:
+
+    python benchmark.py --width 10 80 --depth 1 3 --invalid-ratio 0 0.2 --output results.json
+    python benchmark.py --output current.json --compare results.json --threshold 0.1
+
+Comparison exits with status 1 when ops/s of any scenario dropped by more than --threshold, its p99 latency grew
+by more than --p99-threshold or its peak memory by more than --memory-threshold.
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import types
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import serializer
+from non_blocking_meta_validation_dataclass import NonBlockingValidationDataclass
+from validators import (
+    ValidationExceptionGroup,
+    BasicIntFieldValidator,
+    BasicDictFieldValidator,
+    BasicStringFieldValidator,
+    DictFieldValidator,
+    FieldValidator,
+    IntFieldValidator,
+    StringFieldValidator,
+)
+
+VALIDATOR_MIXES = {
+    # Class based validators of the original API
+    'basic': (BasicIntFieldValidator, BasicStringFieldValidator, BasicDictFieldValidator),
+    # Pure type checks, inlined by the validation plan
+    'typed': (FieldValidator(int), FieldValidator(str), DictFieldValidator()),
+    # Validators with options, called through validate
+    'range': (IntFieldValidator(min_value=0, max_value=10 ** 9), StringFieldValidator(max_length=64),
+              DictFieldValidator(nullable=True)),
+}
+VALUE_FACTORIES = (
+    lambda rng: rng.randrange(10 ** 6),
+    lambda rng: f"value-{rng.randrange(10 ** 6)}",
+    lambda rng: {'key': rng.randrange(100)},
+)
+FIELD_TYPES = (int, str, dict)
+
+
+@dataclass
+class SchemaConfig:
+    width: int = 10
+    depth: int = 1
+    mix: str = 'basic'
+    codegen: bool = False
+
+    @property
+    def label(self) -> str:
+        return f"width={self.width},depth={self.depth},mix={self.mix},codegen={self.codegen}"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    ops_per_sec: float
+    # None for batch scenarios
+    p50_us: Optional[float]
+    p99_us: Optional[float]
+    peak_memory_kb: float
+    params: Dict = field(default_factory=dict)
+
+
+def make_schema(config: SchemaConfig):
+    """Dataclass with config.width leaf fields per level and config.depth levels of nested dataclasses."""
+    validators = VALIDATOR_MIXES[config.mix]
+    nested_class = None
+
+    for level in range(config.depth - 1, -1, -1):
+        annotations = {}
+        namespace = {'__annotations__': annotations}
+        if nested_class is not None:
+            annotations[f'nested_{level}'] = nested_class
+        for index in range(config.width):
+            name = f'level_{level}_field_{index}'
+            kind = index % len(FIELD_TYPES)
+            annotations[name] = FIELD_TYPES[kind]
+            namespace[name] = field(default=None, metadata={
+                'validator': validators[kind],
+                'input_field': f'key_{level}_{index}',
+            })
+
+        schema_class = types.new_class(
+            f'BenchmarkSchemaLevel{level}', (NonBlockingValidationDataclass,), {'codegen': config.codegen},
+            lambda class_namespace: class_namespace.update(namespace)
+        )
+        nested_class = dataclass(schema_class)
+
+    return nested_class
+
+
+def make_rows(config: SchemaConfig, rows_count: int, invalid_ratio: float, seed: int = 0) -> List[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(rows_count):
+        row = {
+            f'key_{level}_{index}': VALUE_FACTORIES[index % len(FIELD_TYPES)](rng)
+            for level in range(config.depth) for index in range(config.width)
+        }
+        if rng.random() < invalid_ratio:
+            # Wrong type for one random leaf
+            row[f'key_{rng.randrange(config.depth)}_{rng.randrange(config.width)}'] = [None]
+        rows.append(row)
+    return rows
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percentile))]
+
+
+def _peak_memory_kb(run: Callable[[], None]) -> float:
+    # Measured in a separate run, tracemalloc slows down allocations
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory / 1024
+
+
+def measure(name: str, operation: Callable[[Any], Any], items: list, repeat: int, params: dict) -> BenchmarkResult:
+    """
+    operation is called for every item and every call is timed, p50 / p99 are latencies of single operations
+    over all repeat runs.
+    """
+    def run():
+        for item in items:
+            operation(item)
+
+    run()
+    latencies = []
+    total_seconds = 0.0
+    perf_counter = time.perf_counter
+    for _ in range(repeat):
+        run_started_at = perf_counter()
+        for item in items:
+            started_at = perf_counter()
+            operation(item)
+            latencies.append(perf_counter() - started_at)
+        total_seconds += perf_counter() - run_started_at
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=len(latencies) / total_seconds if total_seconds else 0.0,
+        p50_us=statistics.median(latencies) * 10 ** 6 if latencies else None,
+        p99_us=_percentile(latencies, 0.99) * 10 ** 6 if latencies else None,
+        peak_memory_kb=_peak_memory_kb(run),
+        params=params,
+    )
+
+
+def measure_batch(name: str, operation: Callable[[], int], repeat: int, params: dict) -> BenchmarkResult:
+    """
+    operation processes a whole batch and returns number of ops it did. Latencies of single operations are not
+    observable, batch scenarios report ops/s and peak memory only.
+    """
+    operation()
+    total_ops = 0
+    total_seconds = 0.0
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        total_ops += operation()
+        total_seconds += time.perf_counter() - started_at
+
+    return BenchmarkResult(
+        name=name,
+        ops_per_sec=total_ops / total_seconds if total_seconds else 0.0,
+        p50_us=None,
+        p99_us=None,
+        peak_memory_kb=_peak_memory_kb(operation),
+        params=params,
+    )
+
+
+def run_scenario(config: SchemaConfig, rows_count: int, invalid_ratio: float, repeat: int) -> List[BenchmarkResult]:
+    schema = make_schema(config)
+    rows = make_rows(config, rows_count, invalid_ratio)
+    instances = schema.from_dicts(rows).instances
+    ndjson = b''.join(json.dumps(row).encode() + b'\n' for row in rows)
+    params = {**config.__dict__, 'rows': rows_count, 'invalid_ratio': invalid_ratio}
+    label = f"{config.label},invalid_ratio={invalid_ratio}"
+
+    def from_dict_row(row: dict):
+        try:
+            schema.from_dict(row)
+        except ValidationExceptionGroup:
+            pass
+
+    def json_dumps_instance(instance):
+        # Baseline of as_json_bytes
+        return json.dumps(instance.as_dict(), separators=(',', ':')).encode()
+
+    def dump_many_instances():
+        serializer.dump_many(instances, io.BytesIO())
+        return max(len(instances), 1)
+
+    def json_dumps_many_instances():
+        # Baseline of dump_many
+        io.BytesIO().write(json.dumps([instance.as_dict() for instance in instances], separators=(',', ':')).encode())
+        return max(len(instances), 1)
+
+    def batch_rows():
+        schema.from_dicts(rows)
+        return len(rows)
+
+    def stream_rows():
+        for _ in schema.iter_from_stream(io.BytesIO(ndjson), format='ndjson'):
+            pass
+        return len(rows)
+
+    return [
+        measure(f"from_dict[{label}]", from_dict_row, rows, repeat, params),
+        measure(f"as_dict[{label}]", schema.as_dict, instances, repeat, params),
+        measure(f"as_json_bytes[{label}]", schema.as_json_bytes, instances, repeat, params),
+        measure(f"json.dumps(as_dict)[{label}]", json_dumps_instance, instances, repeat, params),
+        measure_batch(f"dump_many[{label}]", dump_many_instances, repeat, params),
+        measure_batch(f"json.dumps([as_dict])[{label}]", json_dumps_many_instances, repeat, params),
+        measure_batch(f"from_dicts[{label}]", batch_rows, repeat, params),
+        measure_batch(f"iter_from_stream[{label}]", stream_rows, repeat, params),
+    ]
+
+
+def run_benchmarks(widths=(10,), depths=(1,), mixes=('basic',), invalid_ratios=(0.0,), codegen_modes=(False,),
+                   rows_count: int = 1000, repeat: int = 5) -> dict:
+    results = []
+    for width in widths:
+        for depth in depths:
+            for mix in mixes:
+                for codegen in codegen_modes:
+                    config = SchemaConfig(width=width, depth=depth, mix=mix, codegen=codegen)
+                    for invalid_ratio in invalid_ratios:
+                        results.extend(run_scenario(config, rows_count, invalid_ratio, repeat))
+
+    return {
+        'meta': {
+            'python': sys.version,
+            'platform': platform.platform(),
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'rows': rows_count,
+            'repeat': repeat,
+        },
+        'results': [result.__dict__ for result in results],
+    }
+
+
+def _change(current: Optional[float], baseline: Optional[float]) -> Optional[float]:
+    if current is None or not baseline:
+        return None
+    return current / baseline - 1
+
+
+def compare(current: dict, baseline: dict, threshold: float, p99_threshold: float = 0.25,
+            memory_threshold: float = 0.1) -> List[dict]:
+    """
+    Scenarios present in both runs with relative changes of ops/s, p99 latency and peak memory. Regressions are
+    metrics which got worse by more than their threshold: ops/s dropped below -threshold, p99 grew above
+    p99_threshold (scenarios with latencies only) or peak memory grew above memory_threshold.
+    """
+    baseline_results = {result['name']: result for result in baseline['results']}
+    comparison = []
+    for result in current['results']:
+        baseline_result = baseline_results.get(result['name'])
+        if baseline_result is None or not baseline_result['ops_per_sec']:
+            continue
+        change = _change(result['ops_per_sec'], baseline_result['ops_per_sec'])
+        p99_change = _change(result['p99_us'], baseline_result['p99_us'])
+        memory_change = _change(result['peak_memory_kb'], baseline_result['peak_memory_kb'])
+
+        regressions = []
+        if change < -threshold:
+            regressions.append('ops_per_sec')
+        if p99_change is not None and p99_change > p99_threshold:
+            regressions.append('p99_us')
+        if memory_change is not None and memory_change > memory_threshold:
+            regressions.append('peak_memory_kb')
+        comparison.append({
+            'name': result['name'],
+            'baseline_ops_per_sec': baseline_result['ops_per_sec'],
+            'ops_per_sec': result['ops_per_sec'],
+            'change': change,
+            'p99_change': p99_change,
+            'memory_change': memory_change,
+            'regressions': regressions,
+            'regression': bool(regressions),
+        })
+    return comparison
+
+
+def _format_optional(value: Optional[float], format_spec: str, width: int) -> str:
+    return '-'.rjust(width) if value is None else format(value, format_spec)
+
+
+def format_results(results: dict) -> str:
+    lines = [f"{'scenario':<90} {'ops/s':>12} {'p50 us':>9} {'p99 us':>9} {'peak KiB':>10}"]
+    for result in results['results']:
+        p50 = _format_optional(result['p50_us'], '>9.1f', 9)
+        p99 = _format_optional(result['p99_us'], '>9.1f', 9)
+        lines.append(f"{result['name']:<90} {result['ops_per_sec']:>12.0f} {p50} {p99} {result['peak_memory_kb']:>10.1f}")
+    return "\n".join(lines)
+
+
+def format_comparison(comparison: List[dict]) -> str:
+    lines = [f"{'scenario':<90} {'baseline':>12} {'current':>12} {'change':>8} {'p99':>8} {'memory':>8}"]
+    for row in comparison:
+        flag = f"  REGRESSION ({', '.join(row['regressions'])})" if row['regression'] else ''
+        lines.append(f"{row['name']:<90} {row['baseline_ops_per_sec']:>12.0f} {row['ops_per_sec']:>12.0f} "
+                     f"{row['change']:>+8.1%} {_format_optional(row['p99_change'], '>+8.1%', 8)} "
+                     f"{_format_optional(row['memory_change'], '>+8.1%', 8)}{flag}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--width', type=int, nargs='+', default=[10, 80])
+    parser.add_argument('--depth', type=int, nargs='+', default=[1, 3])
+    parser.add_argument('--mix', nargs='+', default=['basic', 'typed', 'range'], choices=sorted(VALIDATOR_MIXES))
+    parser.add_argument('--invalid-ratio', type=float, nargs='+', default=[0.0, 0.2])
+    parser.add_argument('--codegen', choices=['off', 'on', 'both'], default='both')
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help="write results JSON to this file")
+    parser.add_argument('--compare', help="baseline results JSON to compare with")
+    parser.add_argument('--threshold', type=float, default=0.1, help="allowed relative drop of ops/s")
+    parser.add_argument('--p99-threshold', type=float, default=0.25, help="allowed relative growth of p99 latency")
+    parser.add_argument('--memory-threshold', type=float, default=0.1, help="allowed relative growth of peak memory")
+    args = parser.parse_args(argv)
+
+    codegen_modes = {'off': (False,), 'on': (True,), 'both': (False, True)}[args.codegen]
+    results = run_benchmarks(args.width, args.depth, args.mix, args.invalid_ratio, codegen_modes, args.rows,
+                             args.repeat)
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            comparison = compare(results, json.load(file), args.threshold, args.p99_threshold,
+                                 args.memory_threshold)
+        print()
+        print(format_comparison(comparison))
+        if any(row['regression'] for row in comparison):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
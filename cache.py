@@ -0,0 +1,179 @@
+"""
+Opt-in per class cache of from_dict results for repeated payloads (retries, duplicate deliveries).
+
+    enable_cache(Dataclass, maxsize=10_000, ttl=60)
+    Dataclass.from_dict(dict_data)      # validated once, repeated payloads are served from the cache
+    get_cache(Dataclass).info()
+    disable_cache(Dataclass)
+
+Cache key is built from values of input keys read by the validation plan only, keys unknown to the schema do not
+affect it. Values are keyed together with their types, so 1, 1.0 and True are different keys. Payloads with values
+which can not be frozen into a key (sets, custom objects) are validated as usual.
+
+Only successful results are cached. Instances of frozen dataclasses (all nested dataclasses frozen as well) holding
+values of atomic types only are returned from the cache as is, other results get a new instance built from a deep copy
+of the cached values for every call. Classes with async validators or validators with cacheable = False (item
+validators of collection fields included) always bypass the cache, so does afrom_dict.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import is_dataclass
+from typing import NamedTuple, Optional
+
+_MISSING = ('<missing>',)
+# Values of these types are immutable and used in cache keys as is
+ATOMIC_TYPES = frozenset((int, float, str, bool, bytes, type(None)))
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    bypasses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def freeze(value):
+    """Hashable canonical form of a JSON like value, raises TypeError for values without one."""
+    value_class = value.__class__
+    if value_class in ATOMIC_TYPES:
+        return value_class, value
+    if isinstance(value, dict):
+        return dict, frozenset((freeze(key), freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return value_class, tuple(freeze(item) for item in value)
+    raise TypeError(f"Value of type {value_class.__name__} can not be used in a cache key")
+
+
+def copy_node_values(node_values: list) -> list:
+    return [
+        {name: value if value.__class__ in ATOMIC_TYPES else copy.deepcopy(value) for name, value in values.items()}
+        for values in node_values
+    ]
+
+
+def _is_frozen(cls) -> bool:
+    return is_dataclass(cls) and cls.__dataclass_params__.frozen
+
+
+def _is_atomic(node_values: list) -> bool:
+    return all(value.__class__ in ATOMIC_TYPES for values in node_values for value in values.values())
+
+
+def _validators(plan):
+    """Validators of all leaves of plan, item validators of collection fields included."""
+    for leaf in plan.leaves:
+        yield leaf.validator
+        collection = leaf.collection
+        while collection is not None:
+            if collection.item_validator is not None:
+                yield collection.item_validator
+            if collection.item_plan is not None:
+                yield from _validators(collection.item_plan)
+            collection = collection.item_collection
+
+
+class ValidationCache:
+    """
+    LRU cache of one class. Entries are evicted when there are more than maxsize of them or after ttl seconds.
+    Entry is (frozen instance, None) or (None, node values of ValidationPlan to build a new instance from).
+    """
+
+    def __init__(self, cls, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        plan = cls._get_validation_plan()
+        self.cls = cls
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # Keys whose values are validated and keys whose presence is checked by formatting checks
+        self.input_keys = tuple(dict.fromkeys(
+            [input_key for input_key, _ in plan.routes] +
+            [input_key for _, _, input_key in plan.formatting_checks if input_key is not None]
+        ))
+        self.cacheable = not plan.async_fields and all(validator.cacheable for validator in _validators(plan))
+        self.frozen = all(_is_frozen(node.cls) for node in plan.nodes)
+        self.entries = OrderedDict()
+        self.hits = self.misses = self.bypasses = self.evictions = 0
+        self._lock = threading.Lock()
+
+    def make_key(self, dict_data: dict) -> Optional[tuple]:
+        """None if a value can not be frozen."""
+        try:
+            return tuple(freeze(dict_data.get(input_key, _MISSING)) for input_key in self.input_keys)
+        except TypeError:
+            return None
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def from_dict(self, dict_data: dict):
+        cls = self.cls
+        key = self.make_key(dict_data) if self.cacheable else None
+        plan = cls._get_validation_plan()
+        if key is None:
+            with self._lock:
+                self.bypasses += 1
+            return plan.build_instance(cls._validate_dict_data(plan, dict_data))
+
+        cached = self.get(key)
+        if cached is not None:
+            instance, node_values = cached
+            return instance if instance is not None else plan.build_instance(copy_node_values(node_values))
+
+        node_values = cls._validate_dict_data(plan, dict_data)
+        if self.frozen and _is_atomic(node_values):
+            # Nothing in the instance can be changed by the caller, it is shared by all hits
+            instance = plan.build_instance(node_values)
+            self.put(key, (instance, None))
+            return instance
+        # build_instance consumes node values, input values and mutable values of the instance may be changed
+        # by the caller later
+        self.put(key, (None, copy_node_values(node_values)))
+        return plan.build_instance(node_values)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.bypasses, self.evictions, self.maxsize, len(self.entries))
+
+
+def get_cache(cls) -> Optional[ValidationCache]:
+    return cls.__dict__.get('_validation_cache')
+
+
+def enable_cache(cls, maxsize: int = 1024, ttl: Optional[float] = None) -> ValidationCache:
+    """Cache from_dict results of cls (not of its subclasses), replaces the cache enabled before."""
+    validation_cache = ValidationCache(cls, maxsize, ttl)
+    cls._validation_cache = validation_cache
+    return validation_cache
+
+
+def disable_cache(cls):
+    if '_validation_cache' in cls.__dict__:
+        del cls._validation_cache
@@ -0,0 +1,226 @@
+"""
+Code generation of specialized from_dict / as_dict methods for NonBlockingValidationDataclass subclasses.
+
+Enabled per class with a class keyword:
+
+    @dataclass
+    class Dataclass(NonBlockingValidationDataclass, codegen=True):
+        ...
+
+Generated source of a class can be inspected with get_generated_source(cls) or dumped on generation with
+set_debug_hook(hook). set_enabled(False) makes classes compiled afterwards fall back to the interpreted path.
+"""
+import linecache
+import sys
+from typing import Callable, Optional
+
+from errors import FieldError
+from serializer import PLAIN_VALUE_TYPES
+from validators import ValidationExceptionGroup
+
+
+_enabled = True
+_debug_hook: Optional[Callable[[type, str, str], None]] = None
+
+
+def set_enabled(enabled: bool):
+    """Global switch, classes compiled while disabled keep using the interpreted from_dict / as_dict."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def set_debug_hook(hook: Optional[Callable[[type, str, str], None]]):
+    """Hook is called as hook(cls, method_name, source) for every generated method, None removes it."""
+    global _debug_hook
+    _debug_hook = hook
+
+
+def print_source_hook(cls, method_name: str, source: str):
+    """Debug hook printing generated source to stderr: set_debug_hook(print_source_hook)"""
+    print(f"# {cls.__qualname__}.{method_name}\n{source}", file=sys.stderr)
+
+
+def get_generated_source(cls) -> dict:
+    """Generated source by method name, empty if cls was not compiled."""
+    return dict(cls.__dict__.get('_generated_source', {}))
+
+
+def _literal(value, namespace: dict, name: str) -> str:
+    """Source literal for value, values without a safe literal form are passed through the namespace."""
+    if type(value) in (str, int):
+        return repr(value)
+    namespace[name] = value
+    return name
+
+
+def _compile(cls, method_name: str, source: str, namespace: dict):
+    filename = f"<nbvd-generated {cls.__module__}.{cls.__qualname__}.{method_name}>"
+    # Register the source in linecache so tracebacks from generated code show its lines
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, 'exec'), namespace)
+
+    if _debug_hook is not None:
+        _debug_hook(cls, method_name, source)
+
+    return namespace[method_name]
+
+
+def generate_from_dict_source(plan, namespace: dict) -> str:
+    lines = [
+        "def from_dict(cls, dict_data):",
+        # Subclasses and classes with cache.enable_cache run the interpreted from_dict
+        "    if cls is not _cls or '_validation_cache' in _cls_dict:",
+        "        return _interpreted_from_dict(cls, dict_data)",
+    ]
+
+    static_errors = [message for _, message, input_key in plan.formatting_checks if input_key is None]
+    if static_errors:
+        # Errors which do not depend on input data, from_dict can never succeed
+        lines.append("    formatting_errors = []")
+        for index, (_, message, input_key) in enumerate(plan.formatting_checks):
+            namespace[f'_formatting_message_{index}'] = message
+            indent = "    "
+            if input_key is not None:
+                lines.append(f"    if {_literal(input_key, namespace, f'_formatting_key_{index}')} not in dict_data:")
+                indent = "        "
+            lines.append(f"{indent}formatting_errors.append(AttributeError(_formatting_message_{index}))")
+        lines.append("    raise ValidationExceptionGroup('Formating Errors', formatting_errors)")
+        return "\n".join(lines) + "\n"
+
+    if plan.formatting_checks:
+        keys = [
+            _literal(input_key, namespace, f'_formatting_key_{index}')
+            for index, (_, _, input_key) in enumerate(plan.formatting_checks)
+        ]
+        lines.append(f"    if not ({' in dict_data and '.join(keys)} in dict_data):")
+        lines.append("        formatting_errors = []")
+        for index, ((_, message, _), key) in enumerate(zip(plan.formatting_checks, keys)):
+            namespace[f'_formatting_message_{index}'] = message
+            lines.append(f"        if {key} not in dict_data:")
+            lines.append(f"            formatting_errors.append(AttributeError(_formatting_message_{index}))")
+        lines.append("        raise ValidationExceptionGroup('Formating Errors', formatting_errors)")
+
+    lines.append("    validation_errors = []")
+    leaf_values = {}
+    index = 0
+    for route_index, (input_key, leaves) in enumerate(plan.routes):
+        value = f"value_{route_index}"
+        lines.append(f"    {value} = dict_data.get({_literal(input_key, namespace, f'_input_key_{route_index}')})")
+
+        for leaf in leaves:
+            leaf_values[leaf.node, leaf.name] = value if leaf.collection is None else f"items_{index}"
+            if leaf.type_mismatch is not None:
+                namespace[f'_type_mismatch_{index}'] = leaf.type_mismatch
+                lines.append(f"    validation_errors.append("
+                             f"FieldError({leaf.path!r}, 'type_mismatch', params=_type_mismatch_{index}))")
+
+            if leaf.check_types is not None:
+                check_types = leaf.check_types
+                namespace[f'_type_{index}'] = check_types[0] if len(check_types) == 1 else check_types
+                namespace[f'_type_error_{index}'] = leaf.validator.type_error
+                lines.append(f"    if not isinstance({value}, _type_{index}):")
+                lines.append(f"        validation_errors.append(_type_error_{index}({value}, {leaf.path!r}))")
+                if leaf.collection is not None:
+                    lines.append("    else:")
+            else:
+                namespace[f'_validate_{index}'] = leaf.validator.validate
+                lines.append("    try:")
+                lines.append(f"        _validate_{index}({value}, {leaf.path!r})")
+                lines.append("    except FieldError as e:")
+                lines.append("        validation_errors.append(e)")
+                if leaf.collection is not None:
+                    lines.append("    else:")
+
+            if leaf.collection is not None:
+                # Items are validated only if the container is valid, item errors come with their item paths
+                namespace[f'_collection_{index}'] = leaf.collection.validate
+                lines.append(f"        items_{index}, item_errors = _collection_{index}({value}, {leaf.path!r})")
+                lines.append("        if item_errors:")
+                lines.append("            validation_errors.extend(error for _, error in item_errors)")
+            index += 1
+
+    lines.append("    if validation_errors:")
+    lines.append("        raise ValidationExceptionGroup('Validation Errors', validation_errors)")
+
+    # Nested dataclasses are built children first and passed to their parents as keyword arguments
+    for node_index in range(len(plan.nodes) - 1, -1, -1):
+        node = plan.nodes[node_index]
+        arguments = [
+            f"{name}={value}" for (leaf_node, name), value in leaf_values.items()
+            if leaf_node == node_index and name not in node.non_init_fields
+        ]
+        arguments.extend(
+            f"{child.field_name}=node_{child_index}" for child_index, child in enumerate(plan.nodes)
+            if child.parent == node_index
+        )
+        if node_index:
+            namespace[f'_node_cls_{node_index}'] = node.cls
+        lines.append(f"    node_{node_index} = {f'_node_cls_{node_index}' if node_index else 'cls'}({', '.join(arguments)})")
+        for (leaf_node, name), value in leaf_values.items():
+            if leaf_node == node_index and name in node.non_init_fields:
+                if node.frozen:
+                    lines.append(f"    _object_setattr(node_{node_index}, {name!r}, {value})")
+                else:
+                    lines.append(f"    node_{node_index}.{name} = {value}")
+    lines.append("    return node_0")
+
+    return "\n".join(lines) + "\n"
+
+
+def generate_as_dict_source(cls, namespace: dict) -> str:
+    class_serializer = cls._get_serializer()
+    names = class_serializer.names
+
+    lines = [
+        "def as_dict(self, dirty_only=False):",
+        "    if dirty_only or self.__class__ is not _cls:",
+        "        return _interpreted_as_dict(self, dirty_only)",
+    ]
+    for index, name in enumerate(names):
+        lines.append(f"    value_{index} = self.{name}")
+    lines.append("    return {")
+    for index, name in enumerate(names):
+        if name in class_serializer.deep_fields:
+            # Dicts of dataclass items are not plain values
+            lines.append(f"        {name!r}: self.convert_value(value_{index}),")
+            continue
+        lines.append(f"        {name!r}: value_{index} if value_{index}.__class__ in _plain_value_types "
+                     f"else self.convert_value(value_{index}),")
+    lines.append("    }")
+
+    return "\n".join(lines) + "\n"
+
+
+def compile_class(cls, plan, interpreted_from_dict, interpreted_as_dict):
+    """Generate from_dict / as_dict for cls and install them on the class, unless cls defines its own."""
+    generated_source = {}
+
+    # Async validators can only run in afrom_dict, interpreted from_dict reports them
+    if 'from_dict' not in cls.__dict__ and not plan.async_fields:
+        namespace = {
+            '_cls': cls,
+            '_cls_dict': cls.__dict__,
+            '_object_setattr': object.__setattr__,
+            '_interpreted_from_dict': interpreted_from_dict,
+            'FieldError': FieldError,
+            'ValidationExceptionGroup': ValidationExceptionGroup,
+        }
+        source = generate_from_dict_source(plan, namespace)
+        cls.from_dict = classmethod(_compile(cls, 'from_dict', source, namespace))
+        generated_source['from_dict'] = source
+
+    if 'as_dict' not in cls.__dict__:
+        namespace = {
+            '_cls': cls,
+            '_interpreted_as_dict': interpreted_as_dict,
+            '_plain_value_types': PLAIN_VALUE_TYPES,
+        }
+        source = generate_as_dict_source(cls, namespace)
+        cls.as_dict = _compile(cls, 'as_dict', source, namespace)
+        generated_source['as_dict'] = source
+
+    cls._generated_source = generated_source
@@ -0,0 +1,261 @@
+"""
+Columnar validation of data held as columns: mapping of input key to a list or a NumPy array of values.
+
+    result = Dataclass.from_columns({'attr_01': np.array([1, 2, 3]), 'attr_02': ['a', 'b', None]})
+    result.mask, result.errors, result.select(columns)
+
+Built-in validators (type checks of Basic*FieldValidator classes, FieldValidator, IntFieldValidator,
+FloatFieldValidator, StringFieldValidator, DictFieldValidator) run as mask operations over whole NumPy columns,
+any other validator, list columns and collection fields (items of list[T] and the like) are validated value by
+value. Columns of NumPy arrays are checked by dtype:
+integer and bool dtypes are int, floating dtypes are float and unicode dtypes are str; object arrays and arrays
+checked by other validators are validated value by value on Python values of the column (column.tolist()). NumPy is optional and imported on first validation, without it masks are lists of bools.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional
+
+from errors import FieldError
+from validators import (
+    ValidationExceptionGroup,
+    DictFieldValidator,
+    FieldValidator,
+    FloatFieldValidator,
+    IntFieldValidator,
+    StringFieldValidator,
+)
+
+# NumPy module, set by _import_numpy, None until then and if NumPy is not installed
+np = None
+_numpy_imported = False
+
+# Validators whose checks are known and can run on a whole NumPy column
+VECTORIZED_VALIDATORS = (FieldValidator, IntFieldValidator, FloatFieldValidator, StringFieldValidator,
+                         DictFieldValidator)
+DTYPE_KINDS = {int: 'iub', float: 'f', str: 'U'}
+
+
+@dataclass
+class ColumnarResult:
+    """
+    rows_count - number of rows of every column
+    mask       - validity of every row, NumPy bool array if NumPy is installed, list of bools otherwise
+    errors     - sorted indices of invalid rows by input key, only keys with errors are present
+    instances  - valid instances in row order if requested by build_instances
+    """
+    rows_count: int
+    mask: Any
+    errors: Dict[str, Any] = field(default_factory=dict)
+    instances: Optional[list] = None
+
+    @property
+    def valid_rows(self):
+        return _true_indices(self.mask)
+
+    @property
+    def invalid_rows(self):
+        return _true_indices(_invert(self.mask))
+
+    def select(self, columns: Mapping[str, Any], valid: bool = True) -> Dict[str, Any]:
+        """Columns filtered to valid (or invalid) rows, NumPy arrays stay arrays."""
+        mask = self.mask if valid else _invert(self.mask)
+        selected = {}
+        for key, column in columns.items():
+            if np is not None and isinstance(column, np.ndarray):
+                selected[key] = column[mask]
+            else:
+                selected[key] = [value for value, keep in zip(column, mask) if keep]
+        return selected
+
+
+def _import_numpy():
+    global np, _numpy_imported
+    if not _numpy_imported:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            pass
+        _numpy_imported = True
+
+
+def _true_indices(mask):
+    if np is not None:
+        return np.flatnonzero(mask)
+    return [row for row, value in enumerate(mask) if value]
+
+
+def _invert(mask):
+    if np is not None:
+        return ~mask
+    return [not valid for valid in mask]
+
+
+def _combine(mask, other):
+    if np is not None:
+        mask &= other
+        return mask
+    return [valid and other_valid for valid, other_valid in zip(mask, other)]
+
+
+def _full_mask(rows_count: int, value: bool):
+    if np is not None:
+        return np.full(rows_count, value, dtype=bool)
+    return [value] * rows_count
+
+
+def _vectorized_mask(validator: FieldValidator, column) -> Optional[Any]:
+    """Mask of a NumPy column computed from its dtype, None if the column has to be validated value by value."""
+    if type(validator) not in VECTORIZED_VALIDATORS or column.dtype.kind == 'O' or validator.type not in DTYPE_KINDS:
+        return None
+    if column.dtype.kind not in DTYPE_KINDS[validator.type]:
+        # Typed column can not hold values of validator type (or None)
+        return np.zeros(len(column), dtype=bool)
+
+    mask = np.ones(len(column), dtype=bool)
+    if isinstance(validator, (IntFieldValidator, FloatFieldValidator)):
+        # Negated comparisons keep NaN valid, the same as value < min_value is False for NaN in validate
+        if validator.min_value is not None:
+            mask &= ~(column < validator.min_value)
+        if validator.max_value is not None:
+            mask &= ~(column > validator.max_value)
+    elif isinstance(validator, StringFieldValidator):
+        if validator.min_length is not None or validator.max_length is not None:
+            lengths = np.char.str_len(column)
+            if validator.min_length is not None:
+                mask &= lengths >= validator.min_length
+            if validator.max_length is not None:
+                mask &= lengths <= validator.max_length
+    return mask
+
+
+def _collection_mask(leaf, column) -> list:
+    validate = leaf.validator.validate
+    validate_items = leaf.collection.validate
+    name = leaf.name
+    mask = []
+    for value in column:
+        try:
+            validate(value, name)
+        except FieldError:
+            mask.append(False)
+            continue
+        _, item_errors = validate_items(value, leaf.path)
+        mask.append(not item_errors)
+    return mask
+
+
+def _leaf_mask(leaf, column):
+    if np is not None and isinstance(column, np.ndarray):
+        mask = _vectorized_mask(leaf.validator, column) if leaf.collection is None else None
+        if mask is not None:
+            return mask
+        # Validators get Python values, the same as from_dict, not NumPy scalars
+        column = column.tolist()
+
+    if leaf.collection is not None:
+        mask = _collection_mask(leaf, column)
+        return np.array(mask, dtype=bool) if np is not None else mask
+
+    if leaf.check_types is not None:
+        check_types = leaf.check_types
+        mask = [isinstance(value, check_types) for value in column]
+    else:
+        validate = leaf.validator.validate
+        name = leaf.name
+        mask = []
+        for value in column:
+            try:
+                validate(value, name)
+                mask.append(True)
+            except FieldError:
+                mask.append(False)
+
+    if np is not None:
+        return np.array(mask, dtype=bool)
+    return mask
+
+
+def _missing_column_mask(leaf, rows_count: int):
+    """Missing column is read as None for every row, same as dict_data.get(input_key) of from_dict."""
+    try:
+        leaf.validator.validate(None, leaf.name)
+        return _full_mask(rows_count, True)
+    except FieldError:
+        return _full_mask(rows_count, False)
+
+
+def _to_list(column) -> list:
+    """Python values of a column, NumPy scalars are converted to int / float / str."""
+    if np is not None and isinstance(column, np.ndarray):
+        return column.tolist()
+    return list(column)
+
+
+def validate_columns(cls, columns: Mapping[str, Any], build_instances: bool = False) -> ColumnarResult:
+    """
+    Validate columns against cls. Formatting errors (schema errors or missing columns without input_field)
+    are raised as ValidationExceptionGroup, as from_dict raises them for a single record.
+    """
+    _import_numpy()
+    plan = cls._get_validation_plan()
+    if plan.async_fields:
+        raise TypeError(f"Fields {', '.join(plan.async_fields)} of {cls.__name__} have async validators")
+
+    formatting_errors = plan.get_formatting_errors(columns)
+    if formatting_errors:
+        raise ValidationExceptionGroup("Formating Errors", [error for _, error in formatting_errors])
+
+    lengths = {key: len(column) for key, column in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Columns have different lengths: {lengths}")
+    rows_count = next(iter(lengths.values()), 0)
+
+    mask = _full_mask(rows_count, True)
+    errors = {}
+    for input_key, leaves in plan.routes:
+        column = columns.get(input_key)
+        key_mask = _full_mask(rows_count, True)
+        for leaf in leaves:
+            if leaf.type_mismatch is not None:
+                key_mask = _full_mask(rows_count, False)
+                break
+            leaf_mask = _leaf_mask(leaf, column) if column is not None else _missing_column_mask(leaf, rows_count)
+            key_mask = _combine(key_mask, leaf_mask)
+
+        invalid_rows = _true_indices(_invert(key_mask))
+        if len(invalid_rows):
+            errors[input_key] = invalid_rows
+        mask = _combine(mask, key_mask)
+
+    result = ColumnarResult(rows_count=rows_count, mask=mask, errors=errors)
+    if build_instances:
+        result.instances = _build_instances(plan, columns, result.valid_rows)
+    return result
+
+
+def _build_instances(plan, columns: Mapping[str, Any], valid_rows) -> list:
+    routed_columns = [
+        (_to_list(columns[input_key]) if input_key in columns else None, leaves) for input_key, leaves in plan.routes
+    ]
+    instances = []
+    for row in valid_rows:
+        node_values = [{} for _ in plan.nodes]
+        for column, leaves in routed_columns:
+            value = column[row] if column is not None else None
+            for leaf in leaves:
+                # Items of valid rows are validated again to get converted values (tuples, dataclass items)
+                node_values[leaf.node][leaf.name] = (
+                    value if leaf.collection is None else leaf.collection.validate(value, leaf.path)[0]
+                )
+        instances.append(plan.build_instance(node_values))
+    return instances
+
+
+def get_row(columns: Mapping[str, Any], row: int) -> dict:
+    """Single row of columns as a dict of Python values, e.g. to get error messages of an invalid row from from_dict."""
+    _import_numpy()
+    row_dict = {}
+    for key, column in columns.items():
+        value = column[row]
+        row_dict[key] = value.item() if np is not None and isinstance(value, np.generic) else value
+    return row_dict
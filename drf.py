@@ -0,0 +1,41 @@
+"""
+Optional Django REST framework adapter.
+
+Core of the library raises FieldError and never imports Django / DRF, rest_framework is imported here only when
+a conversion to DRF ValidationError is requested.
+"""
+import sys
+
+from errors import FieldError
+
+NON_FIELD_ERRORS_KEY = 'non_field_errors'
+
+
+def is_drf_validation_error(error: BaseException) -> bool:
+    """True for DRF ValidationError, checked without importing DRF: if it is not imported, it was not raised."""
+    exceptions = sys.modules.get('rest_framework.exceptions')
+    return exceptions is not None and isinstance(error, exceptions.ValidationError)
+
+
+def from_drf_validation_error(error, field_name: str, value) -> FieldError:
+    """FieldError keeping the message of DRF ValidationError raised by a class based validator."""
+    message = error.args[0] if error.args else error.detail
+    return FieldError(field_name, 'invalid', value, {'message': message})
+
+
+def to_drf_validation_error(error: BaseException):
+    """
+    DRF ValidationError for a FieldError or a ValidationExceptionGroup.
+    Errors of a group are put into detail by field path ('nested.field' for nested dataclasses), errors without
+    a field under NON_FIELD_ERRORS_KEY.
+    """
+    from rest_framework.exceptions import ValidationError
+
+    if isinstance(error, BaseExceptionGroup):
+        detail = {}
+        for exception in error.exceptions:
+            field_name = getattr(exception, 'field', None) or NON_FIELD_ERRORS_KEY
+            detail.setdefault(field_name, []).append(str(exception))
+        return ValidationError(detail)
+
+    return ValidationError(str(error), code=getattr(error, 'code', None))
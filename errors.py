@@ -0,0 +1,69 @@
+from typing import Any, Optional
+
+
+class FieldError(Exception):
+    """
+    Core validation error of a single field, no Django / DRF dependency.
+    Keeps the field name, error code, reference to the invalid value and message params; message is formatted
+    from the code template only when it is read (str(error), error.message, error.args[0]).
+
+    Custom validators can raise FieldError(field_name, 'invalid', value, {'message': '...'}) or extend messages
+    in a subclass. Template params missing from params fall back to default_message.
+    """
+    __slots__ = ('field', 'code', 'value', 'params', '_message')
+
+    messages = {
+        'invalid': "{message}",
+        'invalid_type': "Field: {field} raised ValidationError. Value: '{value}' is not of type: {type}",
+        'min_value': "Field: {field} raised ValidationError. Value: '{value}' is less than {min_value}",
+        'max_value': "Field: {field} raised ValidationError. Value: '{value}' is greater than {max_value}",
+        'min_length': "Field: {field} raised ValidationError. Value: '{value}' is shorter than {min_length}",
+        'max_length': "Field: {field} raised ValidationError. Value: '{value}' is longer than {max_length}",
+        'type_mismatch': "Field type: {field_type} does not match custom AttrValidator type: {validator_type}",
+        'timeout': "Field: {field} raised ValidationError. Validation timed out after {timeout}s",
+        'invalid_json': "Invalid JSON: {error}",
+        'not_object': "Record is not a JSON object",
+        'missing_parent': "Field: {field} can not be updated, {parent} is not set",
+        'missing_key': "Field: {field} is not present in input data",
+        'too_many_errors': "Field: {field} has too many invalid items, validation stopped after {max_errors} errors",
+    }
+    default_message = "Field: {field} raised ValidationError. Value: '{value}' is invalid"
+
+    def __init__(self, field: Optional[str], code: str = 'invalid', value: Any = None, params: dict = None):
+        # BaseException.__init__ is not called, args are derived from the lazily formatted message
+        self.field = field
+        self.code = code
+        self.value = value
+        self.params = params
+        self._message = None
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            try:
+                self._message = self.messages[self.code].format(
+                    field=self.field, value=self.value, **(self.params or {})
+                )
+            except KeyError:
+                # e.g. FieldError(field_name) without {'message': ...}, the error itself must not fail on reading
+                self._message = self.default_message.format(field=self.field, value=self.value)
+        return self._message
+
+    @property
+    def args(self) -> tuple:
+        return (self.message,)
+
+    def set_field(self, field: str) -> 'FieldError':
+        """Replace field, e.g. with the path of the item of a collection field, and return the error."""
+        self.field = field
+        self._message = None
+        return self
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(field={self.field!r}, code={self.code!r})"
+
+    def __reduce__(self):
+        return self.__class__, (self.field, self.code, self.value, self.params)
@@ -0,0 +1,324 @@
+"""
+Optional instrumentation of from_dict / as_dict: per class and per field calls, failures, cumulative and max time
+and payload sizes, reported to a pluggable sink.
+
+    stats = instrument(Dataclass, sample_rate=0.01)
+    ...
+    stats.slowest_fields(5)
+    uninstrument(Dataclass)
+
+instrument swaps the cached validation plan and serializer of the class for instrumented copies, uninstrumented
+classes run exactly the same code as before. Generated from_dict / as_dict of codegen classes are removed while the
+class is instrumented. Only calls made in this process are recorded, process pool workers of from_dicts build their
+own plans.
+"""
+import logging
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from serializer import Serializer
+from validation_plan import ValidationPlan
+from validators import FieldValidator
+
+
+class Event(NamedTuple):
+    """
+    operation    - 'from_dict', 'as_dict' or 'to_dict'
+    field        - path of the validated field (nested fields as 'nested.field'), None for the whole call
+    elapsed      - seconds
+    payload_size - number of top level keys of input dict (from_dict) or of the result (as_dict / to_dict),
+                   None for field events
+    """
+    cls: type
+    operation: str
+    field: Optional[str]
+    elapsed: float
+    failed: bool
+    payload_size: Optional[int] = None
+
+
+class Sink(ABC):
+    """Receives an Event for every sampled call and for every field validated during it."""
+
+    @abstractmethod
+    def record(self, event: Event):
+        ...
+
+
+@dataclass
+class Counter:
+    calls: int = 0
+    failures: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    total_payload_size: int = 0
+    max_payload_size: int = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def add(self, event: Event):
+        self.calls += 1
+        self.failures += event.failed
+        self.total_time += event.elapsed
+        if event.elapsed > self.max_time:
+            self.max_time = event.elapsed
+        if event.payload_size is not None:
+            self.total_payload_size += event.payload_size
+            if event.payload_size > self.max_payload_size:
+                self.max_payload_size = event.payload_size
+
+
+class ValidationStats(Sink):
+    """In-memory sink: Counter by (class, operation) and by (class, field path)."""
+
+    def __init__(self):
+        self.calls: Dict[Tuple[type, str], Counter] = {}
+        self.fields: Dict[Tuple[type, str], Counter] = {}
+        self._lock = threading.Lock()
+
+    def record(self, event: Event):
+        counters = self.calls if event.field is None else self.fields
+        key = (event.cls, event.operation if event.field is None else event.field)
+        with self._lock:
+            counter = counters.get(key)
+            if counter is None:
+                counter = counters[key] = Counter()
+            counter.add(event)
+
+    def slowest_fields(self, count: int = 10) -> List[Tuple[type, str, Counter]]:
+        """Fields with the highest cumulative validation time."""
+        with self._lock:
+            items = sorted(self.fields.items(), key=lambda item: item[1].total_time, reverse=True)
+        return [(cls, field_path, counter) for (cls, field_path), counter in items[:count]]
+
+    def as_dict(self) -> dict:
+        """{class name: {'calls': {operation: counter}, 'fields': {field path: counter}}}"""
+        report = {}
+        with self._lock:
+            for group, counters in (('calls', self.calls), ('fields', self.fields)):
+                for (cls, name), counter in counters.items():
+                    class_report = report.setdefault(cls.__qualname__, {'calls': {}, 'fields': {}})
+                    class_report[group][name] = {**counter.__dict__, 'mean_time': counter.mean_time}
+        return report
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self.fields.clear()
+
+
+class CallbackSink(Sink):
+    def __init__(self, callback: Callable[[Event], None]):
+        self.callback = callback
+
+    def record(self, event: Event):
+        self.callback(event)
+
+
+class LoggingSink(Sink):
+    """Logs every event, field events are logged only if they failed or took at least slow_threshold seconds."""
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.DEBUG, slow_threshold: float = 0.0):
+        self.logger = logger or logging.getLogger('non_blocking_meta_validation_dataclass')
+        self.level = level
+        self.slow_threshold = slow_threshold
+
+    def record(self, event: Event):
+        if event.field is not None and not event.failed and event.elapsed < self.slow_threshold:
+            return
+        self.logger.log(
+            self.level, "%s.%s%s: %.1fus%s%s", event.cls.__qualname__, event.operation,
+            f" {event.field}" if event.field is not None else '', event.elapsed * 10 ** 6,
+            " failed" if event.failed else '',
+            f", payload size {event.payload_size}" if event.payload_size is not None else '',
+        )
+
+
+class TimedValidator(FieldValidator):
+    """Wraps validator of a leaf of the instrumented plan and reports its time to the sink."""
+    __slots__ = ('validator', 'cls', 'field_path', 'sink')
+
+    def __init__(self, validator: FieldValidator, cls: type, field_path: str, sink: Sink):
+        super().__init__(validator.type, validator.nullable)
+        self.validator = validator
+        self.cls = cls
+        self.field_path = field_path
+        self.sink = sink
+
+    def validate(self, value, field_name: str):
+        failed = True
+        started_at = time.perf_counter()
+        try:
+            self.validator.validate(value, field_name)
+            failed = False
+        finally:
+            self.sink.record(Event(self.cls, 'from_dict', self.field_path, time.perf_counter() - started_at, failed))
+
+
+class AsyncTimedValidator(TimedValidator):
+    __slots__ = ()
+
+    async def validate(self, value, field_name: str):
+        failed = True
+        started_at = time.perf_counter()
+        try:
+            await self.validator.validate(value, field_name)
+            failed = False
+        finally:
+            self.sink.record(Event(self.cls, 'from_dict', self.field_path, time.perf_counter() - started_at, failed))
+
+
+@dataclass(frozen=True)
+class InstrumentedPlan(ValidationPlan):
+    """
+    Validation plan of an instrumented class, sampled calls are validated by timed_plan with every leaf validator
+    wrapped in TimedValidator, other calls by the original routes.
+    """
+    timed_plan: Optional[ValidationPlan] = None
+    sink: Optional[Sink] = None
+    sample_rate: float = 1.0
+
+    def _record_call(self, started_at: float, errors: Optional[list], dict_data: dict):
+        # errors is None when validation raised
+        failed = errors is None or bool(errors)
+        self.sink.record(Event(self.cls, 'from_dict', None, time.perf_counter() - started_at, failed, len(dict_data)))
+
+    def validate(self, dict_data: dict) -> Tuple[list, list]:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return super().validate(dict_data)
+
+        errors = None
+        started_at = time.perf_counter()
+        try:
+            node_values, errors = self.timed_plan.validate(dict_data)
+        finally:
+            self._record_call(started_at, errors, dict_data)
+        return node_values, errors
+
+    async def avalidate(self, dict_data: dict, concurrency: Optional[int] = None,
+                        timeout: Optional[float] = None) -> Tuple[list, list]:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return await super().avalidate(dict_data, concurrency, timeout)
+
+        errors = None
+        started_at = time.perf_counter()
+        try:
+            node_values, errors = await self.timed_plan.avalidate(dict_data, concurrency, timeout)
+        finally:
+            self._record_call(started_at, errors, dict_data)
+        return node_values, errors
+
+
+@dataclass(frozen=True)
+class InstrumentedSerializer(Serializer):
+    sink: Optional[Sink] = None
+    sample_rate: float = 1.0
+
+    def _timed(self, operation: str, convert, instance) -> dict:
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return convert(self, instance)
+
+        result = None
+        started_at = time.perf_counter()
+        try:
+            result = convert(self, instance)
+        finally:
+            self.sink.record(Event(self.cls, operation, None, time.perf_counter() - started_at, result is None,
+                                   None if result is None else len(result)))
+        return result
+
+    def to_dict(self, instance) -> dict:
+        return self._timed('as_dict', Serializer.to_dict, instance)
+
+    def to_flat_dict(self, instance, dirty_only: bool = False) -> dict:
+        if dirty_only:
+            return super().to_flat_dict(instance, dirty_only)
+        return self._timed('to_dict', Serializer.to_flat_dict, instance)
+
+
+def _build_timed_plan(plan: ValidationPlan, sink: Sink) -> ValidationPlan:
+    timed_leaves = {}
+    for leaf in plan.leaves:
+        timed_validator_class = AsyncTimedValidator if leaf.is_async else TimedValidator
+        timed_leaves[id(leaf)] = leaf.__class__(**{
+            **{plan_field.name: getattr(leaf, plan_field.name) for plan_field in fields(leaf)},
+            'validator': timed_validator_class(leaf.validator, plan.cls, leaf.path, sink),
+            # Inline type checks are timed through validate as well
+            'check_types': None,
+        })
+
+    return ValidationPlan(**{
+        **{plan_field.name: getattr(plan, plan_field.name) for plan_field in fields(ValidationPlan)},
+        'leaves': tuple(timed_leaves[id(leaf)] for leaf in plan.leaves),
+        'routes': tuple(
+            (input_key, tuple(timed_leaves[id(leaf)] for leaf in leaves)) for input_key, leaves in plan.routes
+        ),
+        'routes_by_key': {
+            input_key: tuple(timed_leaves[id(leaf)] for leaf in leaves) for input_key, leaves in plan.routes
+        },
+    })
+
+
+def is_instrumented(cls) -> bool:
+    return '_instrumentation' in cls.__dict__
+
+
+def instrument(cls, sink: Sink = None, sample_rate: float = 1.0) -> Sink:
+    """
+    Record from_dict / afrom_dict / as_dict / to_dict calls of cls (including from_dicts and iter_from_stream) to sink,
+    ValidationStats by default. sample_rate is the fraction of calls recorded, decided per call.
+    Returns the sink.
+    """
+    if not 0.0 < sample_rate <= 1.0:
+        raise ValueError(f"sample_rate must be in (0, 1], got {sample_rate}")
+    if is_instrumented(cls):
+        uninstrument(cls)
+    sink = sink if sink is not None else ValidationStats()
+
+    plan = cls._get_validation_plan()
+    class_serializer = cls._get_serializer()
+    generated_source = cls.__dict__.get('_generated_source')
+    generated_methods = {name: cls.__dict__[name] for name in generated_source or () if name in cls.__dict__}
+    cls._instrumentation = (plan, class_serializer, generated_source, generated_methods)
+
+    # Generated methods do not use the plan, class falls back to the interpreted from_dict / as_dict
+    for name in generated_methods:
+        delattr(cls, name)
+    if generated_source is not None:
+        cls._generated_source = {}
+
+    cls._validation_plan = InstrumentedPlan(
+        **{plan_field.name: getattr(plan, plan_field.name) for plan_field in fields(ValidationPlan)},
+        timed_plan=_build_timed_plan(plan, sink),
+        sink=sink,
+        sample_rate=sample_rate,
+    )
+    cls._serializer = InstrumentedSerializer(
+        **{serializer_field.name: getattr(class_serializer, serializer_field.name)
+           for serializer_field in fields(Serializer)},
+        sink=sink,
+        sample_rate=sample_rate,
+    )
+    return sink
+
+
+def uninstrument(cls):
+    """Restore the original plan, serializer and generated methods of cls."""
+    instrumentation = cls.__dict__.get('_instrumentation')
+    if instrumentation is None:
+        return
+    plan, class_serializer, generated_source, generated_methods = instrumentation
+
+    cls._validation_plan = plan
+    cls._serializer = class_serializer
+    if generated_source is not None:
+        cls._generated_source = generated_source
+    for name, method in generated_methods.items():
+        setattr(cls, name, method)
+    del cls._instrumentation
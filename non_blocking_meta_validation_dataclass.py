@@ -1,94 +1,107 @@
-from dataclasses import dataclass, fields, field
-from typing import List, Any, Type
+from concurrent.futures import Executor
+from dataclasses import FrozenInstanceError, field
+from typing import IO, Any, Iterable, Iterator, Mapping, get_origin
 
-from rest_framework.exceptions import ValidationError
+import batch
+import codegen
+import serializer
+import streaming
+from batch import BatchResult
+from errors import FieldError
+from serializer import Serializer, build_serializer
+from streaming import StreamRecord
+from validation_plan import ValidationPlan, build_validation_plan, unwrap_optional
+from validators import ValidationExceptionGroup
 
-from validators import ValidationExceptionGroup, AttrValidator
 
-
-@dataclass
 class NonBlockingValidationDataclass:
     """
     Format of fields:
     attr1: int = field(default=None, metadata={'validator': Attr1Validator(int, nullable=True)})
     attr2: int = field(default=None, metadata={'validator': Attr2Validator(str, nullable=True)})
     attr3: int = field(default=None, metadata={'validator': Attr3Validator(int, nullable=True)})
+
+    Subclasses declared with codegen=True get from_dict / as_dict generated for their schema on first use,
+    see codegen module.
+
+    Base class has no fields and is not a dataclass itself, so subclasses can be declared with
+    @dataclass(frozen=True) and / or @dataclass(slots=True). Slotted instances have no __dict__, the only
+    slot of the base class keeps fields changed by update_from_dict.
     """
+    __slots__ = ('_dirty_fields',)
+    _codegen = False
+
+    def __init_subclass__(cls, codegen: bool = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # None keeps the inherited value, also when @dataclass(slots=True) recreates the class without kwargs
+        if codegen is not None:
+            cls._codegen = codegen
 
     def convert_value(self, value):
         if isinstance(value, NonBlockingValidationDataclass):
             # Recursively serialize nested dataclasses
             return value.as_dict()
-        elif isinstance(value, list):
-            # Handle lists
+        elif isinstance(value, (list, tuple)):
+            # Handle lists and tuples of collection fields
             return [self.convert_value(item) for item in value]
+        elif isinstance(value, dict):
+            return {key: self.convert_value(item) for key, item in value.items()}
         else:
             return value
 
-    def as_dict(self) -> dict:
-        """Метод для экспорта датакласс в дикт влючая вложенные датаклассы и проперти."""
-        obj_dict = {}
+    def as_dict(self, dirty_only: bool = False) -> dict:
+        """
+        Метод для экспорта датакласс в дикт влючая вложенные датаклассы и проперти (в том числе унаследованные).
+        dirty_only exports only fields changed by update_from_dict, without properties.
+        """
+        cls = self.__class__
+        if cls._codegen and '_validation_plan' not in cls.__dict__:
+            cls._get_validation_plan()
+            if 'as_dict' in cls.__dict__:
+                return self.as_dict(dirty_only)
 
-        class_keys = set(self.__class__.__dict__.keys())
-        for prop in class_keys:
-            if isinstance(getattr(self.__class__, prop), property):
-                obj_dict[prop] = self.convert_value(getattr(self, prop))
+        if dirty_only:
+            return cls._get_serializer().to_dirty_dict(self)
+        return cls._get_serializer().to_dict(self)
 
-        class_fields = set(fields(self))
-        for field in class_fields:
-            if field.init:
-                obj_dict[field.name] = self.convert_value(getattr(self, field.name))
+    def as_json_bytes(self) -> bytes:
+        """Compact JSON of as_dict."""
+        return serializer.dumps(self)
 
-        return obj_dict
+    def dump_to(self, fp: IO[bytes]):
+        """Write compact JSON of as_dict to binary fp, see serializer.dump_many for lists of instances."""
+        fp.write(serializer.dumps(self))
 
     @classmethod
-    def flatten_list_recursive(cls, list_to_flatten: List[Any]) -> List[Any]:
-        """
-        Recursively flatten list of lists
-        [element1, [element2, element3, [element4]]  ->->->   [element1, element2, element3, element4]
-        """
-        flattened_list = []
-        for item in list_to_flatten:
-            if isinstance(item, list):
-                flattened_list.extend(cls.flatten_list_recursive(item))
-            else:
-                flattened_list.append(item)
-        return flattened_list
+    def _get_serializer(cls) -> Serializer:
+        """Exported properties and fields are resolved once per class, same as the validation plan."""
+        class_serializer = cls.__dict__.get('_serializer')
+        if class_serializer is None:
+            class_serializer = build_serializer(cls)
+            cls._serializer = class_serializer
+        return class_serializer
 
     @staticmethod
     def _get_field_type(dataclass_field: field) -> type:
-        if hasattr(dataclass_field, "__origin__"):
-            return dataclass_field.__origin__
-        return dataclass_field.type
+        """Class of the field annotation: list for list[int], T for Optional[T]."""
+        field_type, _ = unwrap_optional(dataclass_field.type)
+        return get_origin(field_type) or field_type
 
     @classmethod
-    def _validate_field_formatting(cls, dataclass_field: field, dict_data: dict):
-        field_formatting_errors = []
-        field_type = cls._get_field_type(dataclass_field)
-
-        if not issubclass(field_type, NonBlockingValidationDataclass):
-            try:
-                if not dataclass_field.metadata.get('validator'):
-                    raise AttributeError(f"Field '{dataclass_field.name}' has no validator attribute in field metadata")
-            except AttributeError as err:
-                field_formatting_errors.append(err)
-
-            try:
-                if not dataclass_field.metadata.get('input_field') and dataclass_field.name not in dict_data:
-                    raise AttributeError(f"Field '{dataclass_field.name}' has no input_field attribute in field metadata "
-                                         f"and field '{dataclass_field.name}' not present in input data.")
-            except AttributeError as err:
-                field_formatting_errors.append(err)
-
-        if isinstance(field_type, type) and issubclass(field_type, NonBlockingValidationDataclass):
-            nested_field_formatting_errors = [
-                cls._validate_field_formatting(nested_dataclass_field, dict_data) for nested_dataclass_field
-                in fields(field_type)
-            ]
-            field_formatting_errors.extend(nested_field_formatting_errors)
-
-        #TODO: Make custom Validator optional - use strict type validation in validator not included
-        return field_formatting_errors
+    def _get_validation_plan(cls) -> ValidationPlan:
+        """
+        Validation plan is built once per class on the first call and cached in the class __dict__.
+        It can not be built in __init_subclass__ because fields are only known after @dataclass is applied.
+        """
+        plan = cls.__dict__.get('_validation_plan')
+        if plan is None:
+            plan = build_validation_plan(cls)
+            cls._validation_plan = plan
+            if cls._codegen and codegen.is_enabled():
+                codegen.compile_class(
+                    cls, plan, NonBlockingValidationDataclass.from_dict.__func__, NonBlockingValidationDataclass.as_dict
+                )
+        return plan
 
     @classmethod
     def from_dict(cls, dict_data: dict):
@@ -97,52 +110,170 @@ class NonBlockingValidationDataclass:
 
         Usage:
         validated_dataclass = Dataclass.from_dict(dict_data)
+
+        Results of repeated payloads can be cached with cache.enable_cache(Dataclass).
+        """
+        plan = cls._get_validation_plan()
+        validation_cache = cls.__dict__.get('_validation_cache')
+        if validation_cache is not None:
+            return validation_cache.from_dict(dict_data)
+        if 'from_dict' in cls.__dict__.get('_generated_source', ()):
+            # Generated from_dict was installed on the class while building the plan
+            return cls.from_dict(dict_data)
+
+        return plan.build_instance(cls._validate_dict_data(plan, dict_data))
+
+    @staticmethod
+    def _validate_dict_data(plan: ValidationPlan, dict_data: dict) -> list:
+        """Validated values of every node of the plan, raises ValidationExceptionGroup."""
+        formatting_errors = plan.get_formatting_errors(dict_data)
+        if formatting_errors:
+            raise ValidationExceptionGroup("Formating Errors", [error for _, error in formatting_errors])
+
+        node_values, validation_errors = plan.validate(dict_data)
+        if validation_errors:
+            raise ValidationExceptionGroup("Validation Errors", [error for _, error in validation_errors])
+
+        return node_values
+
+    @classmethod
+    async def afrom_dict(cls, dict_data: dict, concurrency: int = None, timeout: float = None):
+        """
+        Same as from_dict, but async validators (async def __call__) of all fields run concurrently:
+
+        Usage:
+        validated_dataclass = await Dataclass.afrom_dict(dict_data, concurrency=5, timeout=2.0)
+
+        concurrency limits number of async validators running at once, validators not finished within timeout seconds
+        are cancelled and reported in ValidationExceptionGroup as any other validation error.
         """
-        formatting_errors = cls.flatten_list_recursive(
-            [cls._validate_field_formatting(dataclass_field, dict_data) for dataclass_field in fields(cls)]
-        )
+        plan = cls._get_validation_plan()
 
+        formatting_errors = plan.get_formatting_errors(dict_data)
         if formatting_errors:
-            raise ValidationExceptionGroup("Formating Errors", formatting_errors)
-
-        validation_errors = []
-        instance = cls()
-
-        for field in fields(cls):
-            field_name = field.name
-
-            is_metadata_input_field_provided = field.metadata.get('input_field', False)
-            if is_metadata_input_field_provided:
-                value = dict_data.get(is_metadata_input_field_provided)
-            else:
-                value = dict_data.get(field_name)
-
-            validator: AttrValidator = field.metadata.get('validator')
-            field_type: Type = field.type
-
-            # Typing on dataclass field must match the type included in custom validator if both present
-            if validator and field_type:
-                validator_type = getattr(validator, 'type', None)
-                if validator_type != field_type:
-                    validation_errors.append(
-                        ValidationError(
-                            f"Field type: {field_type} does not match custom AttrValidator type: {validator_type}"
-                        )
-                    )
-
-            if validator:
-                try:
-                    validator(value, field_name)()
-                    setattr(instance, field_name, value)
-                except ValidationError as e:
-                    validation_errors.append(e)
+            raise ValidationExceptionGroup("Formating Errors", [error for _, error in formatting_errors])
 
+        node_values, validation_errors = await plan.avalidate(dict_data, concurrency, timeout)
         if validation_errors:
-            raise ValidationExceptionGroup("Validation Errors", validation_errors)
+            raise ValidationExceptionGroup("Validation Errors", [error for _, error in validation_errors])
 
-        return instance
+        return plan.build_instance(node_values)
 
     @classmethod
-    def to_dict(cls):
-        # TODO: Add reverse serialization into a dict
-        pass
+    def from_dicts(cls, dicts_data: Iterable[dict], workers: int = None, chunk_size: int = None,
+                   executor: Executor = None, as_records: bool = False) -> BatchResult:
+        """
+        Validate many records in one pass. Invalid records do not raise, their errors are collected into the result
+        indexed by row number and field name:
+
+        Usage:
+        result = Dataclass.from_dicts(rows)
+        result.instances, result.errors_by_row()
+
+        workers > 1 validates chunks of records on a process pool (or on the given executor), small batches are
+        still validated in process. See batch.validate_parallel.
+
+        as_records=True returns valid records as a records.RecordStore of parallel lists of field values instead of
+        a list of instances, for large result sets kept in memory.
+        """
+        if workers is not None and workers > 1:
+            return batch.validate_parallel(cls, dicts_data, workers, chunk_size, executor, as_records)
+        return batch.validate_chunk(cls, dicts_data, as_records=as_records)
+
+    @classmethod
+    def from_columns(cls, columns: Mapping[str, Any], build_instances: bool = False) -> 'columnar.ColumnarResult':
+        """
+        Validate data held in columns (lists or NumPy arrays by input key) without turning it into rows:
+
+        Usage:
+        result = Dataclass.from_columns({'attr_01': np.array([1, 2]), 'attr_02': ['a', None]})
+        result.mask, result.errors, result.select(columns)
+
+        See columnar.validate_columns.
+        """
+        # Imported on first use, NumPy is not loaded by workers which never validate columns
+        import columnar
+
+        return columnar.validate_columns(cls, columns, build_instances)
+
+    @classmethod
+    def iter_from_stream(cls, source, **kwargs) -> Iterator[StreamRecord]:
+        """
+        Validate records of NDJSON or JSON array file / binary stream while it is being read:
+
+        Usage:
+        for record in Dataclass.iter_from_stream('feed.ndjson', skip_invalid=True, start_offset=last_end_offset):
+            record.instance, record.end_offset
+
+        See streaming.iter_validated for options.
+        """
+        return streaming.iter_validated(cls, source, **kwargs)
+
+    def update_from_dict(self, delta: dict):
+        """
+        Partial update: validate only fields (nested included) read from the input keys present in delta and
+        apply all of them or none, errors are raised as ValidationExceptionGroup the same way as by from_dict.
+        Updated fields are tracked as dirty, see as_dict(dirty_only=True) and to_dict(dirty_only=True).
+
+        Usage:
+        instance.update_from_dict({'attr_01': 2})
+        """
+        plan = self.__class__._get_validation_plan()
+        updates, validation_errors = plan.validate_delta(delta)
+
+        node_instances = {}
+        for leaf, value in updates:
+            node = plan.nodes[leaf.node]
+            if node.frozen:
+                raise FrozenInstanceError(f"cannot update field '{leaf.path}' of frozen {node.cls.__name__}")
+            if plan.get_node_instance(self, leaf.node, node_instances) is None:
+                validation_errors.append((leaf.path, FieldError(leaf.name, 'missing_parent', value,
+                                                                {'parent': leaf.path.rsplit('.', 1)[0]})))
+        if validation_errors:
+            raise ValidationExceptionGroup("Validation Errors", [error for _, error in validation_errors])
+
+        for leaf, value in updates:
+            instance = node_instances[leaf.node]
+            setattr(instance, leaf.name, value)
+            instance._get_own_dirty_fields(create=True).add(leaf.name)
+        return self
+
+    def _get_own_dirty_fields(self, create: bool = False) -> set:
+        """Names of fields of this instance changed by update_from_dict, kept outside of dataclass fields."""
+        dirty_fields = getattr(self, '_dirty_fields', None)
+        if dirty_fields is None:
+            dirty_fields = set()
+            if create:
+                object.__setattr__(self, '_dirty_fields', dirty_fields)
+        return dirty_fields
+
+    def get_dirty_fields(self) -> set:
+        """Paths of fields changed by update_from_dict, nested fields as 'nested.field'."""
+        dirty_fields = set(self._get_own_dirty_fields())
+        for field_plan in self.__class__._get_validation_plan().fields:
+            value = getattr(self, field_plan.name) if field_plan.nested is not None else None
+            if isinstance(value, NonBlockingValidationDataclass):
+                dirty_fields.update(f'{field_plan.name}.{path}' for path in value.get_dirty_fields())
+        return dirty_fields
+
+    def clear_dirty_fields(self):
+        self._get_own_dirty_fields().clear()
+        for field_plan in self.__class__._get_validation_plan().fields:
+            value = getattr(self, field_plan.name) if field_plan.nested is not None else None
+            if isinstance(value, NonBlockingValidationDataclass):
+                value.clear_dirty_fields()
+
+    def to_dict(self, dirty_only: bool = False) -> dict:
+        """
+        Reverse of from_dict: flat dict in the input shape, keys are renamed back to input_field of every field and
+        fields of nested dataclasses are put into the same top level dict.
+        dirty_only exports only fields changed by update_from_dict.
+
+        Usage:
+        Dataclass.from_dict(dict_data).to_dict()  ->->->  dict_data without keys unknown to the dataclass
+        """
+        return self.__class__._get_serializer().to_flat_dict(self, dirty_only)
+
+    def to_json_bytes(self) -> bytes:
+        """Compact JSON of to_dict, see serializer.dump_many(instances, fp, flat=True) for lists of instances."""
+        return serializer.dumps_flat(self)
@@ -0,0 +1,178 @@
+"""
+Array backed store of validated records: values of every field are kept in parallel lists instead of one
+dataclass instance per record, nested dataclasses in stores of their own.
+
+    result = Dataclass.from_dicts(rows, as_records=True)
+    store = result.instances
+    store[0].attr_01, len(store), [view.as_dict() for view in store]
+
+Records are handed out as RecordView objects, views read attributes from the columns and are created on access.
+as_dict / to_dict / to_instance of a view and methods of the class called on a view build a regular instance of
+the class for the call.
+"""
+import inspect
+from dataclasses import MISSING, fields
+from typing import Dict, Iterator, List, Type, Union
+
+
+class RecordView:
+    """Record of a RecordStore, attributes are read from the store columns. Properties of the class work on views."""
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: 'RecordStore', index: int):
+        self._store = store
+        self._index = index
+
+    def __getattr__(self, name: str):
+        store = self._store
+        column = store.columns.get(name)
+        if column is not None:
+            return column[self._index]
+        nested_store = store.nested.get(name)
+        if nested_store is not None:
+            return RecordView(nested_store, self._index)
+        attribute = getattr(store.cls, name)
+        if isinstance(attribute, property):
+            return attribute.fget(self)
+        if inspect.isfunction(attribute):
+            # Methods may read any attribute (dirty fields, slots), they are called on the instance
+            return getattr(self.to_instance(), name)
+        return attribute
+
+    def __setattr__(self, name: str, value):
+        if name in RecordView.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{self._store.cls.__name__} record view is read only")
+
+    def __reduce__(self):
+        return RecordView, (self._store, self._index)
+
+    def _row_values(self) -> tuple:
+        """Values of compared fields of the record read from the columns, nested records as tuples of their own."""
+        store = self._store
+        return tuple(
+            store.columns[name][self._index] if name in store.columns
+            else RecordView(store.nested[name], self._index)._row_values()
+            for name in store.compare_fields
+        )
+
+    def __eq__(self, other):
+        if isinstance(other, RecordView):
+            if self._store.cls is other._store.cls:
+                return self._row_values() == other._row_values()
+            return self.to_instance() == other.to_instance()
+        return self.to_instance() == other
+
+    def __hash__(self):
+        # Views are hashable as the instances of the class are, equal views have equal row values
+        if self._store.cls.__hash__ is None:
+            raise TypeError(f"unhashable type: '{self._store.cls.__name__}' record view")
+        return hash(self._row_values())
+
+    def __repr__(self):
+        return f"RecordView({self.to_instance()!r})"
+
+    def to_instance(self):
+        return self._store.get_instance(self._index)
+
+    def as_dict(self) -> dict:
+        return self.to_instance().as_dict()
+
+    def to_dict(self) -> dict:
+        return self.to_instance().to_dict()
+
+
+class RecordStore:
+    """
+    columns        - values by field name, one list per field of cls
+    nested         - RecordStore by name of nested dataclass field, with the same number of records
+    compare_fields - names of fields compared by __eq__ of cls, in field order
+    """
+
+    def __init__(self, cls: Type):
+        plan = cls._get_validation_plan()
+        self.cls = cls
+        self.columns: Dict[str, list] = {}
+        self.nested: Dict[str, RecordStore] = {}
+        self.length = 0
+        # Field defaults are resolved once, they are stored for fields missing in validated values
+        self.defaults = {}
+        self.init_fields = {}
+        # Fields compared by the generated __eq__ of the class, views compare and hash them from the columns
+        self.compare_fields = [dataclass_field.name for dataclass_field in fields(cls) if dataclass_field.compare]
+
+        nested_fields = {field_plan.name: field_plan.nested for field_plan in plan.fields if field_plan.nested}
+        for dataclass_field in fields(cls):
+            name = dataclass_field.name
+            self.init_fields[name] = dataclass_field.init
+            if name in nested_fields:
+                self.nested[name] = RecordStore(nested_fields[name].cls)
+                continue
+            self.columns[name] = []
+            if dataclass_field.default is not MISSING:
+                self.defaults[name] = (dataclass_field.default, None)
+            elif dataclass_field.default_factory is not MISSING:
+                self.defaults[name] = (None, dataclass_field.default_factory)
+
+        # Store of every node of the validation plan, node values of a record are appended by node index
+        self.node_stores: List[RecordStore] = [self]
+        for node in plan.nodes[1:]:
+            self.node_stores.append(self.node_stores[node.parent].nested[node.field_name])
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[RecordView, List[RecordView]]:
+        if isinstance(index, slice):
+            return [RecordView(self, record_index) for record_index in range(*index.indices(self.length))]
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("record index out of range")
+        return RecordView(self, index)
+
+    def __iter__(self) -> Iterator[RecordView]:
+        for index in range(self.length):
+            yield RecordView(self, index)
+
+    def _append_values(self, values: dict):
+        defaults = self.defaults
+        for name, column in self.columns.items():
+            if name in values:
+                column.append(values[name])
+            elif name in defaults:
+                default, default_factory = defaults[name]
+                column.append(default_factory() if default_factory is not None else default)
+            else:
+                column.append(None)
+        self.length += 1
+
+    def append_node_values(self, node_values: list):
+        """Append a record validated by ValidationPlan.validate."""
+        for store, values in zip(self.node_stores, node_values):
+            store._append_values(values)
+
+    def extend(self, other: 'RecordStore'):
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+        for name, nested_store in self.nested.items():
+            nested_store.extend(other.nested[name])
+        self.length += other.length
+
+    def get_instance(self, index: int):
+        """Regular dataclass instance of the record."""
+        init_values = {}
+        non_init_values = {}
+        for name, column in self.columns.items():
+            (init_values if self.init_fields[name] else non_init_values)[name] = column[index]
+        for name, nested_store in self.nested.items():
+            (init_values if self.init_fields[name] else non_init_values)[name] = nested_store.get_instance(index)
+
+        instance = self.cls(**init_values)
+        for name, value in non_init_values.items():
+            object.__setattr__(instance, name, value)
+        return instance
+
+    def to_instances(self) -> list:
+        return [self.get_instance(index) for index in range(self.length)]
@@ -0,0 +1,213 @@
+"""
+Per class serializer of NonBlockingValidationDataclass instances into a dict or compact JSON bytes.
+
+Exported properties (including inherited ones) and init fields are resolved once per class, JSON is encoded from
+the exported dicts by one shared C encoder.
+"""
+import json
+from dataclasses import dataclass, fields
+from typing import IO, Iterable, Tuple, Type
+
+from records import RecordView
+
+# Values of these types are exported by as_dict as is
+PLAIN_VALUE_TYPES = frozenset((int, float, str, bool, dict, type(None)))
+
+
+@dataclass(frozen=True)
+class Serializer:
+    """
+    names                - exported attribute names, properties first and then init fields
+    custom_convert_value - class overrides convert_value, as_dict has to call it for every non plain value
+    flat_fields          - reverse of from_dict input mapping: (field name, input key, nested flat_fields) triples,
+                           input key is None for nested dataclass fields. Input keys read by several fields are
+                           exported from the first one only. Third item of collection fields with dataclass items
+                           is the function converting items to their input shape.
+    deep_fields          - names of collection fields with dataclass items, converted even if their value is a dict
+    """
+    cls: Type
+    names: Tuple[str, ...]
+    custom_convert_value: bool
+    flat_fields: tuple = ()
+    deep_fields: frozenset = frozenset()
+
+    def to_dict(self, instance) -> dict:
+        convert = instance.convert_value if self.custom_convert_value else convert_value
+
+        obj_dict = {}
+        for name in self.names:
+            value = getattr(instance, name)
+            obj_dict[name] = value if value.__class__ in PLAIN_VALUE_TYPES else convert(value)
+        for name in self.deep_fields:
+            obj_dict[name] = convert(obj_dict[name])
+        return obj_dict
+
+    def to_dirty_dict(self, instance) -> dict:
+        """as_dict of fields changed by update_from_dict only, nested dataclasses without changes are left out."""
+        dirty_fields = instance._get_own_dirty_fields()
+        convert = instance.convert_value if self.custom_convert_value else convert_value
+
+        obj_dict = {}
+        for field_plan in self.cls._get_validation_plan().fields:
+            name = field_plan.name
+            if field_plan.nested is not None:
+                value = getattr(instance, name)
+                if _is_dataclass_instance(value):
+                    nested_dict = value.as_dict(dirty_only=True)
+                    if nested_dict:
+                        obj_dict[name] = nested_dict
+            elif name in dirty_fields:
+                value = getattr(instance, name)
+                plain = value.__class__ in PLAIN_VALUE_TYPES and name not in self.deep_fields
+                obj_dict[name] = value if plain else convert(value)
+        return obj_dict
+
+    def to_flat_dict(self, instance, dirty_only: bool = False) -> dict:
+        flat_dict = {}
+        if dirty_only:
+            _fill_dirty_flat_dict(instance, self.flat_fields, flat_dict)
+        else:
+            _fill_flat_dict(instance, self.flat_fields, flat_dict)
+        return flat_dict
+
+
+def _is_dataclass_instance(value) -> bool:
+    """NonBlockingValidationDataclass instance, checked by its class API to avoid a circular import."""
+    return hasattr(value.__class__, '_get_serializer')
+
+
+def convert_value(value):
+    """Same conversion as NonBlockingValidationDataclass.convert_value."""
+    if _is_dataclass_instance(value):
+        return value.as_dict()
+    elif isinstance(value, (list, tuple)):
+        return [item if item.__class__ in PLAIN_VALUE_TYPES else convert_value(item) for item in value]
+    elif isinstance(value, dict):
+        return {
+            key: item if item.__class__ in PLAIN_VALUE_TYPES else convert_value(item) for key, item in value.items()
+        }
+    return value
+
+
+def convert_flat_value(value):
+    """Value of a collection field with dataclass items in from_dict input shape, items exported by to_dict."""
+    if _is_dataclass_instance(value):
+        return value.to_dict()
+    elif isinstance(value, (list, tuple)):
+        return [convert_flat_value(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: convert_flat_value(item) for key, item in value.items()}
+    return value
+
+
+def _fill_flat_dict(instance, flat_fields: tuple, flat_dict: dict):
+    for name, input_key, nested in flat_fields:
+        value = getattr(instance, name)
+        if input_key is not None:
+            flat_dict[input_key] = value if nested is None else nested(value)
+        elif _is_dataclass_instance(value):
+            _fill_flat_dict(value, nested, flat_dict)
+
+
+def _fill_dirty_flat_dict(instance, flat_fields: tuple, flat_dict: dict):
+    dirty_fields = instance._get_own_dirty_fields()
+    for name, input_key, nested in flat_fields:
+        if input_key is None:
+            value = getattr(instance, name)
+            if _is_dataclass_instance(value):
+                _fill_dirty_flat_dict(value, nested, flat_dict)
+        elif name in dirty_fields:
+            value = getattr(instance, name)
+            flat_dict[input_key] = value if nested is None else nested(value)
+
+
+def _default(value):
+    """Values the C encoder does not know: nested dataclasses (e.g. from a custom convert_value) and record views."""
+    if _is_dataclass_instance(value) or isinstance(value, RecordView):
+        return value.as_dict()
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+# One encoder for all calls, json.dumps with separators builds a new one per call. Dicts built by the per class
+# serializers are encoded by the C encoder in one pass. They are new objects on every call, circular references
+# can only come from field values and end with RecursionError instead of the check on every container.
+_encode = json.JSONEncoder(separators=(',', ':'), default=_default, check_circular=False).encode
+
+
+def dumps(instance) -> bytes:
+    return _encode(instance).encode('ascii')
+
+
+def dumps_flat(instance) -> bytes:
+    return _encode(instance.to_dict()).encode('ascii')
+
+
+def dump_many(instances: Iterable, fp: IO[bytes], chunk_size: int = 1000, flat: bool = False):
+    """
+    Write instances to binary fp as a JSON array, every chunk_size instances are encoded by one encoder call and
+    written. flat writes instances in from_dict input shape (to_dict) instead of as_dict.
+    """
+    fp.write(b'[')
+    separator = b''
+    chunk = []
+    for instance in instances:
+        chunk.append(instance.to_dict() if flat else instance.as_dict())
+        if len(chunk) == chunk_size:
+            # Brackets of the encoded chunk list are stripped, chunks are joined into one array
+            fp.write(separator + _encode(chunk)[1:-1].encode('ascii'))
+            separator = b','
+            chunk.clear()
+    if chunk:
+        fp.write(separator + _encode(chunk)[1:-1].encode('ascii'))
+    fp.write(b']')
+
+
+def _build_flat_fields(plan, seen_input_keys: set) -> tuple:
+    flat_fields = []
+    for field_plan in plan.fields:
+        if field_plan.nested is not None:
+            flat_fields.append((field_plan.name, None, _build_flat_fields(field_plan.nested, seen_input_keys)))
+        elif field_plan.input_key not in seen_input_keys:
+            seen_input_keys.add(field_plan.input_key)
+            convert = convert_flat_value if _has_dataclass_items(field_plan.collection) else None
+            flat_fields.append((field_plan.name, field_plan.input_key, convert))
+    return tuple(flat_fields)
+
+
+def _has_dataclass_items(collection) -> bool:
+    while collection is not None:
+        if collection.item_plan is not None:
+            return True
+        collection = collection.item_collection
+    return False
+
+
+def build_serializer(cls) -> Serializer:
+    from non_blocking_meta_validation_dataclass import NonBlockingValidationDataclass as base_class
+
+    properties = {}
+    for klass in reversed(cls.__mro__):
+        if klass is object or klass is base_class:
+            continue
+        for name, value in klass.__dict__.items():
+            if isinstance(value, property):
+                properties[name] = None
+            else:
+                # Subclass replaced the property of a base class with a plain attribute
+                properties.pop(name, None)
+
+    names = list(properties)
+    names.extend(dataclass_field.name for dataclass_field in fields(cls) if dataclass_field.init)
+    names = tuple(dict.fromkeys(names))
+
+    plan = cls._get_validation_plan()
+    return Serializer(
+        cls=cls,
+        names=names,
+        custom_convert_value=cls.convert_value is not base_class.convert_value,
+        flat_fields=_build_flat_fields(plan, set()),
+        deep_fields=frozenset(
+            field_plan.name for field_plan in plan.fields
+            if field_plan.name in names and _has_dataclass_items(field_plan.collection)
+        ),
+    )
@@ -0,0 +1,219 @@
+"""
+Streaming validation of newline delimited JSON or a top level JSON array of records.
+
+Records are parsed and validated one by one, the document is never loaded into memory as a whole.
+Every yielded StreamRecord carries byte offsets of the record, to resume after a crash pass end_offset
+of the last processed record as start_offset.
+"""
+import codecs
+import itertools
+import json
+import os
+from typing import Any, BinaryIO, Iterator, List, NamedTuple, Optional, Union
+
+from batch import RowError
+from errors import FieldError
+
+NDJSON = 'ndjson'
+JSON_ARRAY = 'array'
+AUTO = 'auto'
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Protects against reading the rest of a broken document into memory while looking for the end of a record
+MAX_RECORD_SIZE = 64 * 1024 * 1024
+WHITESPACE = ' \t\n\r'
+
+
+class StreamRecord(NamedTuple):
+    """
+    index      - number of the record counted from start_offset
+    offset     - byte offset where the record starts
+    end_offset - byte offset right after the record, where reading can be resumed
+    instance   - validated dataclass instance or None for invalid record
+    errors     - list of RowError(index, field, error), field is None for records which are not valid JSON objects
+    """
+    index: int
+    offset: int
+    end_offset: int
+    instance: Any
+    errors: List[RowError]
+
+
+def _validate_record(plan, index: int, offset: int, end_offset: int, record) -> StreamRecord:
+    if not isinstance(record, dict):
+        error = FieldError(None, 'not_object', record)
+        return StreamRecord(index, offset, end_offset, None, [RowError(index, None, error)])
+
+    instance, errors = plan.run(record)
+    return StreamRecord(
+        index, offset, end_offset, instance,
+        [RowError(index, field_name, error) for field_name, error in errors]
+    )
+
+
+def _iter_ndjson(stream: BinaryIO, offset: int) -> Iterator[tuple]:
+    """(offset, end_offset, record or ValueError) for every non blank line."""
+    for line in stream:
+        end_offset = offset + len(line)
+        if line.strip():
+            try:
+                yield offset, end_offset, json.loads(line)
+            except ValueError as err:
+                # JSONDecodeError or UnicodeDecodeError of a line which is not valid UTF-8
+                yield offset, end_offset, err
+        offset = end_offset
+
+
+class _ArrayReader:
+    """Incremental reader of values of a top level JSON array, keeps only a chunk of the document in the buffer."""
+
+    def __init__(self, stream: BinaryIO, offset: int, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.utf8_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.eof = False
+        # Byte offset of mark_position in the buffer, positions only move forward so offsets are counted incrementally
+        self.mark_position = 0
+        self.mark_offset = offset
+
+    def read_chunk(self) -> bool:
+        chunk = self.stream.read(self.chunk_size)
+        self.eof = not chunk
+        # Drop consumed part of the buffer before growing it
+        self.byte_offset(self.position)
+        self.buffer = self.buffer[self.position:] + self.utf8_decoder.decode(chunk, final=self.eof)
+        self.position = self.mark_position = 0
+        return not self.eof
+
+    def byte_offset(self, position: int) -> int:
+        segment = self.buffer[self.mark_position:position]
+        self.mark_offset += len(segment) if segment.isascii() else len(segment.encode('utf-8'))
+        self.mark_position = position
+        return self.mark_offset
+
+    def next_char(self) -> Optional[str]:
+        """Skip whitespace and return the next character without consuming it, None at the end of stream."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in WHITESPACE:
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read_chunk():
+                return None
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(
+            f"{message} at byte offset {self.byte_offset(self.position)}", self.buffer, self.position
+        )
+
+    def expect(self, chars: str) -> str:
+        char = self.next_char()
+        if char is None or char not in chars:
+            raise self.error(f"Expecting one of {chars!r}")
+        self.position += 1
+        return char
+
+    def expect_end(self):
+        """Only whitespace may follow the closing bracket, anything else is not a JSON array document."""
+        if self.next_char() is not None:
+            raise self.error("Extra data after the end of the array")
+
+    def decode_value(self):
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # Value touching the end of buffer may continue in the next chunk (numbers, literals)
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof or len(self.buffer) - self.position > MAX_RECORD_SIZE:
+                    raise
+            self.read_chunk()
+
+    def __iter__(self) -> Iterator[tuple]:
+        """(offset, end_offset, record) for every value of the array."""
+        if self.next_char() == '[':
+            self.position += 1
+            if self.next_char() == ']':
+                self.position += 1
+                self.expect_end()
+                return
+        else:
+            # Resumed from end_offset of a previous record, a separator must follow
+            if self.expect(',]') == ']':
+                self.expect_end()
+                return
+
+        while True:
+            self.next_char()
+            offset = self.byte_offset(self.position)
+            try:
+                value = self.decode_value()
+            except json.JSONDecodeError as err:
+                raise json.JSONDecodeError(f"{err.msg} in record at byte offset {offset}", err.doc, err.pos) from err
+            yield offset, self.byte_offset(self.position), value
+            if self.expect(',]') == ']':
+                self.expect_end()
+                return
+
+
+def _detect_format(stream: BinaryIO, start_offset: int) -> str:
+    while True:
+        char = stream.read(1)
+        if not char:
+            return NDJSON
+        if char not in b' \t\n\r':
+            stream.seek(start_offset)
+            # Resuming inside of an array starts right after a record, at ',' or ']'
+            return JSON_ARRAY if char in b'[,]' else NDJSON
+
+
+def iter_validated(cls, source: Union[str, os.PathLike, BinaryIO], format: str = AUTO, skip_invalid: bool = False,
+                   max_records: Optional[int] = None, start_offset: int = 0,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[StreamRecord]:
+    """
+    Generator of StreamRecord for every record of source validated against cls.
+
+    source       - file path or binary stream, stream must be seekable for start_offset or format detection
+    format       - 'ndjson', 'array' or 'auto' to detect it by the first non whitespace byte
+    skip_invalid - do not yield invalid records
+    max_records  - stop after reading this many records (valid or invalid)
+    start_offset - byte offset to resume from, end_offset of the last processed record
+
+    Lines of NDJSON which are not valid JSON (or not valid UTF-8) are yielded as invalid records with an
+    'invalid_json' error. Syntax errors of an array document are fatal: json.JSONDecodeError with the byte offset
+    of the broken record is raised, records yielded before it are complete and reading can be resumed from end_offset
+    of the last yielded record once the document is fixed. Data after the closing bracket of the array raises as well.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as stream:
+            yield from iter_validated(cls, stream, format, skip_invalid, max_records, start_offset, chunk_size)
+        return
+
+    stream = source
+    if start_offset:
+        stream.seek(start_offset)
+    if format == AUTO:
+        format = _detect_format(stream, start_offset)
+
+    if format == NDJSON:
+        records = _iter_ndjson(stream, start_offset)
+    elif format == JSON_ARRAY:
+        records = iter(_ArrayReader(stream, start_offset, chunk_size))
+    else:
+        raise ValueError(f"Unknown stream format: {format}")
+
+    plan = cls._get_validation_plan()
+    for index, (offset, end_offset, record) in enumerate(itertools.islice(records, max_records)):
+        if isinstance(record, ValueError):
+            error = FieldError(None, 'invalid_json', params={'error': record})
+            stream_record = StreamRecord(index, offset, end_offset, None, [RowError(index, None, error)])
+        else:
+            stream_record = _validate_record(plan, index, offset, end_offset, record)
+
+        if not (skip_invalid and stream_record.errors):
+            yield stream_record
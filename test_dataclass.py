@@ -1,14 +1,49 @@
-from dataclasses import dataclass, field
-from unittest import TestCase
+import asyncio
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, dataclass, field, fields
+from typing import Optional
+from unittest import TestCase, mock, skipUnless
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from rest_framework.exceptions import ValidationError
+
+import batch
+import benchmark
+import cache
+import codegen
+import columnar
+import drf
+import instrumentation
+import records
+import serializer
+from errors import FieldError
 from non_blocking_meta_validation_dataclass import (
     NonBlockingValidationDataclass
 )
 from validators import (
     ValidationExceptionGroup,
+    AttrValidator,
     BasicIntFieldValidator,
     BasicDictFieldValidator,
-    BasicStringFieldValidator
+    BasicStringFieldValidator,
+    DictFieldValidator,
+    FieldValidator,
+    FloatFieldValidator,
+    IntFieldValidator,
+    LegacyValidatorAdapter,
+    StringFieldValidator,
+    get_field_validator,
 )
 
 
@@ -153,7 +188,7 @@ class TestFormatting(TestCase):
         class DoubleNestedDataclass(NonBlockingValidationDataclass):
             attr_05: int = field(                                                                                        # CORRECT: validator present, NO 'input_field' BUT key with the same name IS in input_data
                 default=None,
-                metadata={'validator': BasicDictFieldValidator}
+                metadata={'validator': BasicIntFieldValidator}
             )
             double_nested_field_01: str = field(                                                                         # CORRECT: Validator present, input field is present in input data
                 default=None,
@@ -185,6 +220,8 @@ class TestFormatting(TestCase):
 
         result_dataclass = DataclassForFormatterCorrect.from_dict(data)
         self.assertIsInstance(result_dataclass, DataclassForFormatterCorrect)
+        self.assertEqual(123, result_dataclass.attr_03.nested_field_02.attr_05)
+        self.assertEqual('example string', result_dataclass.attr_03.nested_field_02.double_nested_field_01)
 
 
 class TestValidation(TestCase):
@@ -265,3 +302,1423 @@ class TestValidation(TestCase):
 
         result_dataclass = DataclassForFormatterCorrect.from_dict(data)
         self.assertIsInstance(result_dataclass, DataclassForFormatterCorrect)
+
+
+class TestValidationPlan(TestCase):
+    def test_validation_plan__built_once_and_cached_per_class(self):
+        @dataclass
+        class DataclassWithPlan(NonBlockingValidationDataclass):
+            attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+            attr_02: int = field(default=None, metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_06'})
+
+        data = {'attr_01': 'example string', 'attr_06': 3}
+
+        first_result = DataclassWithPlan.from_dict(data)
+        plan = DataclassWithPlan._get_validation_plan()
+        second_result = DataclassWithPlan.from_dict(data)
+
+        self.assertIs(plan, DataclassWithPlan._get_validation_plan())
+        self.assertEqual(('attr_01', 'attr_06'), tuple(field_plan.input_key for field_plan in plan.fields))
+        self.assertEqual(first_result, second_result)
+        self.assertEqual(3, second_result.attr_02)
+
+    def test_validation_plan__not_shared_with_subclass(self):
+        @dataclass
+        class BaseDataclass(NonBlockingValidationDataclass):
+            attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+
+        @dataclass
+        class ChildDataclass(BaseDataclass):
+            attr_02: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+
+        BaseDataclass.from_dict({'attr_01': 'example string'})
+        result = ChildDataclass.from_dict({'attr_01': 'example string', 'attr_02': 3})
+
+        self.assertIsNot(BaseDataclass._get_validation_plan(), ChildDataclass._get_validation_plan())
+        self.assertEqual(3, result.attr_02)
+
+
+class TestCodegen(TestCase):
+    @staticmethod
+    def extract_verbose_errors_from_exception_groups(context):
+        return tuple(exc.args[0] for exc in context.exception.exceptions)
+
+    @staticmethod
+    def make_dataclasses(**class_kwargs):
+        class DataclassForCodegen(NonBlockingValidationDataclass, **class_kwargs):
+            attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+            attr_02: dict = field(default=None, metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_06'})
+            attr_03: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'attr_04'})
+
+            @property
+            def attr_property(self):
+                return self.attr_01
+
+        return dataclass(DataclassForCodegen)
+
+    def test_codegen__generated_methods_match_interpreted_path(self):
+        compiled_class = self.make_dataclasses(codegen=True)
+        interpreted_class = self.make_dataclasses()
+
+        data = {'attr_01': 1, 'attr_04': 'example string', 'attr_06': {'example_key': 'example_value'}}
+        invalid_data = {'attr_01': 'example string', 'attr_04': 'example string', 'attr_06': 3}
+
+        for dataclass_type in (compiled_class, interpreted_class):
+            with self.assertRaises(ValidationExceptionGroup) as context:
+                dataclass_type.from_dict(data)
+            self.assertEqual(
+                ("Field type: <class 'dict'> does not match custom AttrValidator type: <class 'int'>",
+                 "Field: attr_02 raised ValidationError. Value: '{'example_key': 'example_value'}' is not of type: <class 'int'>"),
+                self.extract_verbose_errors_from_exception_groups(context)
+            )
+
+            with self.assertRaises(ValidationExceptionGroup) as context:
+                dataclass_type.from_dict(invalid_data)
+            self.assertEqual(
+                ("Field: attr_01 raised ValidationError. Value: 'example string' is not of type: <class 'int'>",
+                 "Field type: <class 'dict'> does not match custom AttrValidator type: <class 'int'>"),
+                self.extract_verbose_errors_from_exception_groups(context)
+            )
+
+            with self.assertRaises(ValidationExceptionGroup) as context:
+                dataclass_type.from_dict({'attr_04': 'example string'})
+            self.assertEqual(
+                ("Field 'attr_01' has no input_field attribute in field metadata "
+                 "and field 'attr_01' not present in input data.",),
+                self.extract_verbose_errors_from_exception_groups(context)
+            )
+
+        self.assertIn('from_dict', codegen.get_generated_source(compiled_class))
+        self.assertEqual({}, codegen.get_generated_source(interpreted_class))
+
+    def test_codegen__as_dict_and_successful_from_dict(self):
+        @dataclass
+        class DataclassForCodegen(NonBlockingValidationDataclass, codegen=True):
+            attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+            attr_02: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'attr_04'})
+
+            @property
+            def attr_property(self):
+                return self.attr_01 * 2
+
+        generated = []
+        codegen.set_debug_hook(lambda cls, method_name, source: generated.append(method_name))
+        try:
+            result = DataclassForCodegen.from_dict({'attr_01': 1, 'attr_04': 'example string'})
+        finally:
+            codegen.set_debug_hook(None)
+
+        self.assertEqual(['from_dict', 'as_dict'], generated)
+        self.assertEqual({'attr_01': 1, 'attr_02': 'example string', 'attr_property': 2}, result.as_dict())
+
+    def test_codegen__disabled__falls_back_to_interpreted_path(self):
+        dataclass_type = self.make_dataclasses(codegen=True)
+        codegen.set_enabled(False)
+        try:
+            with self.assertRaises(ValidationExceptionGroup):
+                dataclass_type.from_dict({'attr_01': 1, 'attr_04': 'example string', 'attr_06': 3})
+        finally:
+            codegen.set_enabled(True)
+
+        self.assertEqual({}, codegen.get_generated_source(dataclass_type))
+        self.assertNotIn('from_dict', dataclass_type.__dict__)
+
+
+class TestBatchValidation(TestCase):
+    def test_from_dicts__valid_and_invalid_rows__should_return_instances_and_errors_by_row(self):
+        @dataclass
+        class DataclassForBatch(NonBlockingValidationDataclass):
+            attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+            attr_02: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'attr_06'})
+
+        data = [
+            {'attr_01': 1, 'attr_06': 'example string'},
+            {'attr_01': 'example string', 'attr_06': 3},
+            {'attr_06': 'example string'},
+            {'attr_01': 2, 'attr_06': 'example string', 'attr_07': {'example_key': 'example_value'}},
+        ]
+
+        result = DataclassForBatch.from_dicts(data)
+
+        self.assertEqual([1, 2], [instance.attr_01 for instance in result.instances])
+        self.assertEqual([0, 3], result.rows)
+        self.assertEqual([1, 2], result.invalid_rows)
+        self.assertEqual(
+            {
+                1: {
+                    'attr_01': ["Field: attr_01 raised ValidationError. Value: 'example string' is not of type: <class 'int'>"],
+                    'attr_02': ["Field: attr_02 raised ValidationError. Value: '3' is not of type: <class 'str'>"],
+                },
+                2: {
+                    'attr_01': ["Field 'attr_01' has no input_field attribute in field metadata "
+                                "and field 'attr_01' not present in input data."],
+                },
+            },
+            result.errors_by_row()
+        )
+
+    def test_from_dicts__accepts_generator(self):
+        @dataclass
+        class DataclassForBatch(NonBlockingValidationDataclass):
+            attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+
+        result = DataclassForBatch.from_dicts({'attr_01': number} for number in range(5))
+
+        self.assertEqual([0, 1, 2, 3, 4], [instance.attr_01 for instance in result.instances])
+        self.assertEqual([], result.errors)
+
+
+@dataclass
+class DataclassForStreaming(NonBlockingValidationDataclass):
+    attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+    attr_02: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'attr_06'})
+
+
+class TestStreaming(TestCase):
+    NDJSON_DATA = (
+        b'{"attr_01": 1, "attr_06": "example string"}\n'
+        b'\n'
+        b'{"attr_01": "example string", "attr_06": "example string"}\n'
+        b'{"attr_01": 3, \n'
+        b'{"attr_01": 4, "attr_06": "\xc3\xa9xample string"}\n'
+    )
+    ARRAY_DATA = (
+        b' [{"attr_01": 1, "attr_06": "\xc3\xa9xample string"},\n'
+        b'  {"attr_01": "example string", "attr_06": "example string"}, 5,\n'
+        b'  {"attr_01": 4, "attr_06": "example string", "attr_07": {"example_key": [1, 2, 3]}}]\n'
+    )
+
+    def test_iter_from_stream__ndjson__should_yield_instances_and_errors_per_record(self):
+        records = list(DataclassForStreaming.iter_from_stream(io.BytesIO(self.NDJSON_DATA)))
+
+        self.assertEqual([1, None, None, 4], [record.instance and record.instance.attr_01 for record in records])
+        self.assertEqual(
+            "Field: attr_01 raised ValidationError. Value: 'example string' is not of type: <class 'int'>",
+            records[1].errors[0].message
+        )
+        self.assertIsNone(records[2].errors[0].field)
+        self.assertEqual(len(self.NDJSON_DATA), records[-1].end_offset)
+
+    def test_iter_from_stream__json_array__should_yield_instances_and_errors_per_record(self):
+        records = list(DataclassForStreaming.iter_from_stream(io.BytesIO(self.ARRAY_DATA), chunk_size=7))
+
+        self.assertEqual([1, None, None, 4], [record.instance and record.instance.attr_01 for record in records])
+        self.assertEqual('éxample string', records[0].instance.attr_02)
+        self.assertEqual("Record is not a JSON object", records[2].errors[0].message)
+        for record in records:
+            self.assertEqual(b'{' if record.index != 2 else b'5', self.ARRAY_DATA[record.offset:record.offset + 1])
+
+    def test_iter_from_stream__max_records_and_resume_from_offset(self):
+        for data in (self.NDJSON_DATA, self.ARRAY_DATA):
+            first_records = list(DataclassForStreaming.iter_from_stream(io.BytesIO(data), max_records=2))
+            resumed_records = list(DataclassForStreaming.iter_from_stream(
+                io.BytesIO(data), start_offset=first_records[-1].end_offset, skip_invalid=True
+            ))
+
+            self.assertEqual(2, len(first_records))
+            self.assertEqual([4], [record.instance.attr_01 for record in resumed_records])
+
+    def test_iter_from_stream__file_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'feed.ndjson')
+            with open(path, 'wb') as file:
+                file.write(self.NDJSON_DATA)
+
+            records = list(DataclassForStreaming.iter_from_stream(path, format='ndjson', skip_invalid=True))
+
+        self.assertEqual([1, 4], [record.instance.attr_01 for record in records])
+
+    def test_iter_from_stream__ndjson__invalid_utf8_line__should_yield_invalid_json_error(self):
+        data = b'{"attr_01": 1, "attr_06": "\xff"}\n' + self.NDJSON_DATA
+
+        records = list(DataclassForStreaming.iter_from_stream(io.BytesIO(data)))
+
+        self.assertEqual('invalid_json', records[0].errors[0].error.code)
+        self.assertEqual([None, 1, None, None, 4], [record.instance and record.instance.attr_01 for record in records])
+
+    def test_iter_from_stream__json_array__syntax_errors__should_raise(self):
+        broken_data = (
+            self.ARRAY_DATA + b'{"attr_01": 5, "attr_06": "example string"}\n',
+            b'[{"attr_01": 1, "attr_06": "example string"}]\n{"attr_01": 2, "attr_06": "example string"}\n',
+            b'[]x',
+            self.ARRAY_DATA.replace(b'5,', b'5 6,'),
+            self.ARRAY_DATA.replace(b'"attr_01": 4', b'"attr_01": 4,,'),
+        )
+        for data in broken_data:
+            with self.subTest(data=data), self.assertRaises(json.JSONDecodeError):
+                list(DataclassForStreaming.iter_from_stream(io.BytesIO(data), chunk_size=7))
+
+
+class TestParallelBatchValidation(TestCase):
+    @staticmethod
+    def make_data(rows_count):
+        return [
+            {'attr_01': row if row % 10 else str(row), 'attr_06': 'example string'}
+            for row in range(rows_count)
+        ]
+
+    def test_from_dicts__workers__should_keep_input_order_of_instances_and_errors(self):
+        data = self.make_data(1000)
+
+        result = DataclassForStreaming.from_dicts(iter(data), workers=2, chunk_size=64)
+        expected_result = DataclassForStreaming.from_dicts(data)
+
+        self.assertEqual(expected_result.rows, result.rows)
+        self.assertEqual(expected_result.instances, result.instances)
+        self.assertEqual(
+            [(error.row, error.field, error.message) for error in expected_result.errors],
+            [(error.row, error.field, error.message) for error in result.errors]
+        )
+        self.assertEqual(list(range(0, 1000, 10)), result.invalid_rows)
+
+    def test_from_dicts__workers_small_batch__should_validate_in_process(self):
+        for chunk_size in (None, 5):
+            with mock.patch('batch.ProcessPoolExecutor') as pool:
+                result = DataclassForStreaming.from_dicts(self.make_data(20), workers=4, chunk_size=chunk_size)
+
+            pool.assert_not_called()
+            self.assertEqual(18, len(result.instances))
+
+    def test_get_chunk_size(self):
+        self.assertEqual(batch.MIN_CHUNK_SIZE, batch.get_chunk_size(100, 4))
+        self.assertEqual(25_000, batch.get_chunk_size(400_000, 4))
+        self.assertEqual(batch.MAX_CHUNK_SIZE, batch.get_chunk_size(10_000_000, 4))
+
+
+class SlowAsyncIntFieldValidator(AttrValidator):
+    type = int
+    delay = 0.2
+
+    async def __call__(self, *args, **kwargs):
+        await asyncio.sleep(self.delay)
+        super().__call__(self.type)
+        if self.value < 0:
+            raise ValidationError(f"Field: {self.field_name} raised ValidationError. Value: '{self.value}' is negative")
+
+
+class TestAsyncValidation(TestCase):
+    @staticmethod
+    def extract_verbose_errors_from_exception_groups(context):
+        return tuple(exc.args[0] for exc in context.exception.exceptions)
+
+    @dataclass
+    class DataclassForAsync(NonBlockingValidationDataclass):
+        attr_01: int = field(default=None, metadata={'validator': SlowAsyncIntFieldValidator})
+        attr_02: int = field(default=None, metadata={'validator': SlowAsyncIntFieldValidator})
+        attr_03: int = field(default=None, metadata={'validator': SlowAsyncIntFieldValidator})
+        attr_04: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+
+    def test_afrom_dict__async_validators_run_concurrently(self):
+        data = {'attr_01': 1, 'attr_02': 2, 'attr_03': 3, 'attr_04': 'example string'}
+
+        started_at = time.perf_counter()
+        result = asyncio.run(self.DataclassForAsync.afrom_dict(data))
+
+        self.assertLess(time.perf_counter() - started_at, 0.5)
+        self.assertEqual((1, 2, 3, 'example string'), (result.attr_01, result.attr_02, result.attr_03, result.attr_04))
+
+    def test_afrom_dict__errors_in_field_order(self):
+        data = {'attr_01': -1, 'attr_02': 2, 'attr_03': 'example string', 'attr_04': 4}
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            asyncio.run(self.DataclassForAsync.afrom_dict(data, concurrency=1))
+
+        self.assertEqual(
+            ("Field: attr_01 raised ValidationError. Value: '-1' is negative",
+             "Field: attr_03 raised ValidationError. Value: 'example string' is not of type: <class 'int'>",
+             "Field: attr_04 raised ValidationError. Value: '4' is not of type: <class 'str'>"),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+
+    def test_afrom_dict__timeout__should_raise_validation_errors(self):
+        data = {'attr_01': 1, 'attr_02': 2, 'attr_03': 3, 'attr_04': 'example string'}
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            asyncio.run(self.DataclassForAsync.afrom_dict(data, timeout=0.01))
+
+        self.assertEqual(
+            tuple(f"Field: {name} raised ValidationError. Validation timed out after 0.01s"
+                  for name in ('attr_01', 'attr_02', 'attr_03')),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+
+    def test_from_dict__async_validators__should_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            self.DataclassForAsync.from_dict({'attr_01': 1, 'attr_02': 2, 'attr_03': 3, 'attr_04': 'example string'})
+
+
+class TestFieldValidators(TestCase):
+    @staticmethod
+    def extract_verbose_errors_from_exception_groups(context):
+        return tuple(exc.args[0] for exc in context.exception.exceptions)
+
+    def test_field_validators__options__should_raise_validation_errors(self):
+        @dataclass
+        class DataclassForFieldValidators(NonBlockingValidationDataclass):
+            attr_01: int = field(default=None, metadata={'validator': IntFieldValidator(min_value=0, max_value=10)})
+            attr_02: int = field(default=None, metadata={'validator': IntFieldValidator(min_value=0, max_value=10)})
+            attr_03: str = field(default=None, metadata={'validator': StringFieldValidator(min_length=2, max_length=4)})
+            attr_04: str = field(default=None, metadata={'validator': StringFieldValidator(min_length=2, max_length=4)})
+            attr_05: dict = field(default=None, metadata={'validator': DictFieldValidator()})
+
+        data = {'attr_01': -1, 'attr_02': 11, 'attr_03': 'e', 'attr_04': 'example string', 'attr_05': None}
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassForFieldValidators.from_dict(data)
+
+        self.assertEqual(
+            ("Field: attr_01 raised ValidationError. Value: '-1' is less than 0",
+             "Field: attr_02 raised ValidationError. Value: '11' is greater than 10",
+             "Field: attr_03 raised ValidationError. Value: 'e' is shorter than 2",
+             "Field: attr_04 raised ValidationError. Value: 'example string' is longer than 4",
+             "Field: attr_05 raised ValidationError. Value: 'None' is not of type: <class 'dict'>"),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+
+    def test_field_validators__nullable_and_shared_instance__should_return_dataclass_instance(self):
+        nullable_int_validator = IntFieldValidator(nullable=True)
+
+        @dataclass
+        class DataclassForFieldValidators(NonBlockingValidationDataclass):
+            attr_01: int = field(default=None, metadata={'validator': nullable_int_validator})
+            attr_02: int = field(default=None, metadata={'validator': nullable_int_validator, 'input_field': 'attr_06'})
+            attr_03: str = field(default=None, metadata={'validator': StringFieldValidator(nullable=True, max_length=4)})
+
+        result = DataclassForFieldValidators.from_dict({'attr_01': None, 'attr_06': 3, 'attr_03': None})
+
+        self.assertEqual((None, 3, None), (result.attr_01, result.attr_02, result.attr_03))
+        plan = DataclassForFieldValidators._get_validation_plan()
+        self.assertIs(nullable_int_validator, plan.fields[0].validator)
+        self.assertEqual((int, type(None)), plan.fields[0].check_types)
+        self.assertIsNone(plan.fields[2].check_types)
+
+    def test_field_validators__overridden_validate__should_not_be_inlined(self):
+        class EvenIntFieldValidator(IntFieldValidator):
+            def validate(self, value, field_name: str):
+                super().validate(value, field_name)
+                if value % 2:
+                    raise FieldError(field_name, 'invalid', value, {'message': 'Value is odd'})
+
+        class UpperStringFieldValidator(StringFieldValidator):
+            def validate(self, value, field_name: str):
+                super().validate(value, field_name)
+                if not value.isupper():
+                    raise FieldError(field_name, 'invalid', value, {'message': 'Value is not upper case'})
+
+        for codegen_enabled in (False, True):
+            @dataclass
+            class DataclassForOverriddenValidators(NonBlockingValidationDataclass, codegen=codegen_enabled):
+                attr_01: int = field(default=None, metadata={'validator': EvenIntFieldValidator()})
+                attr_02: str = field(default=None, metadata={'validator': UpperStringFieldValidator()})
+
+            with self.subTest(codegen=codegen_enabled):
+                self.assertIsNone(EvenIntFieldValidator().check_types)
+                self.assertIsNone(UpperStringFieldValidator().check_types)
+                self.assertEqual(2, DataclassForOverriddenValidators.from_dict({'attr_01': 2, 'attr_02': 'A'}).attr_01)
+                with self.assertRaises(ValidationExceptionGroup) as context:
+                    DataclassForOverriddenValidators.from_dict({'attr_01': 3, 'attr_02': 'a'})
+                self.assertEqual(('Value is odd', 'Value is not upper case'),
+                                 self.extract_verbose_errors_from_exception_groups(context))
+
+    def test_get_field_validator__class_based_validators__should_be_adapted(self):
+        class PositiveIntFieldValidator(AttrValidator):
+            type = int
+
+            def __call__(self, *args, **kwargs):
+                super().__call__(self.type)
+                if self.value <= 0:
+                    raise ValidationError(f"Field: {self.field_name} raised ValidationError. Value is not positive")
+
+        basic_validator = get_field_validator(BasicIntFieldValidator)
+        custom_validator = get_field_validator(PositiveIntFieldValidator)
+
+        self.assertEqual((int,), basic_validator.check_types)
+        self.assertIsInstance(custom_validator, LegacyValidatorAdapter)
+        self.assertIs(int, custom_validator.type)
+        custom_validator.validate(1, 'attr_01')
+        with self.assertRaises(FieldError) as context:
+            custom_validator.validate(0, 'attr_01')
+        self.assertEqual("Field: attr_01 raised ValidationError. Value is not positive", context.exception.message)
+
+    def test_field_validators__should_pickle(self):
+        validator = IntFieldValidator(nullable=True, min_value=0)
+
+        unpickled_validator = pickle.loads(pickle.dumps(validator))
+
+        self.assertEqual(repr(validator), repr(unpickled_validator))
+        self.assertEqual('IntFieldValidator(type=<class \'int\'>, nullable=True, min_value=0, max_value=None)', repr(validator))
+
+
+class TestFieldError(TestCase):
+    def test_field_error__message_is_formatted_lazily(self):
+        class Value:
+            formatted = 0
+
+            def __str__(self):
+                Value.formatted += 1
+                return 'value'
+
+        error = FieldError('attr_01', 'invalid_type', Value(), {'type': int})
+
+        self.assertEqual(0, Value.formatted)
+        self.assertEqual("Field: attr_01 raised ValidationError. Value: 'value' is not of type: <class 'int'>", str(error))
+        self.assertEqual(error.message, error.args[0])
+        self.assertEqual(1, Value.formatted)
+
+    def test_field_error__should_pickle(self):
+        error = pickle.loads(pickle.dumps(FieldError('attr_01', 'min_value', -1, {'min_value': 0})))
+
+        self.assertEqual(('attr_01', 'min_value', -1), (error.field, error.code, error.value))
+        self.assertEqual("Field: attr_01 raised ValidationError. Value: '-1' is less than 0", error.message)
+
+    def test_field_error__missing_params__should_fall_back_to_default_message(self):
+        self.assertEqual("Field: attr_01 raised ValidationError. Value: 'None' is invalid", str(FieldError('attr_01')))
+        self.assertEqual(
+            "Field: attr_01 raised ValidationError. Value: '-1' is invalid",
+            FieldError('attr_01', 'min_value', -1).message
+        )
+        self.assertEqual("Custom message", FieldError('attr_01', params={'message': "Custom message"}).message)
+
+    def test_core_modules__should_not_import_django(self):
+        code = (
+            "import sys, non_blocking_meta_validation_dataclass, validators; "
+            "print(any(module.split('.')[0] in ('django', 'rest_framework') for module in sys.modules))"
+        )
+        output = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout
+
+        self.assertEqual('False', output.strip())
+
+    def test_to_drf_validation_error__should_group_messages_by_field(self):
+        group = ValidationExceptionGroup("Validation Errors", [
+            FieldError('attr_01', 'min_value', -1, {'min_value': 0}),
+            AttributeError("Field 'attr_02' has no validator attribute in field metadata"),
+        ])
+
+        drf_error = drf.to_drf_validation_error(group)
+
+        self.assertIsInstance(drf_error, ValidationError)
+        self.assertEqual(
+            {'attr_01': ["Field: attr_01 raised ValidationError. Value: '-1' is less than 0"],
+             'non_field_errors': ["Field 'attr_02' has no validator attribute in field metadata"]},
+            drf_error.detail
+        )
+
+
+class TestSerialization(TestCase):
+    @dataclass
+    class NestedDataclassForSerialization(NonBlockingValidationDataclass):
+        nested_attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+
+        @property
+        def nested_property(self):
+            return self.nested_attr_01 + 1
+
+    @dataclass
+    class BaseDataclassForSerialization(NonBlockingValidationDataclass):
+        attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+
+        @property
+        def base_property(self):
+            return self.attr_01.upper()
+
+    @dataclass
+    class DataclassForSerialization(BaseDataclassForSerialization):
+        attr_02: dict = field(default=None, metadata={'validator': BasicDictFieldValidator})
+        attr_03: list = field(default=None)
+        attr_04: object = field(default=None)
+
+    def make_instance(self):
+        nested = self.NestedDataclassForSerialization(nested_attr_01=1)
+        return self.DataclassForSerialization(
+            attr_01='éxample string',
+            attr_02={'example_key': [1.5, None, True], 2: 'example_value'},
+            attr_03=[nested, 'example string'],
+            attr_04=nested,
+        )
+
+    def test_as_dict__should_include_inherited_properties_and_nested_dataclasses(self):
+        nested_dict = {'nested_attr_01': 1, 'nested_property': 2}
+
+        self.assertEqual(
+            {
+                'base_property': 'ÉXAMPLE STRING',
+                'attr_01': 'éxample string',
+                'attr_02': {'example_key': [1.5, None, True], 2: 'example_value'},
+                'attr_03': [nested_dict, 'example string'],
+                'attr_04': nested_dict,
+            },
+            self.make_instance().as_dict()
+        )
+
+    def test_as_json_bytes__should_match_json_dumps_of_as_dict(self):
+        instance = self.make_instance()
+
+        self.assertEqual(
+            json.dumps(instance.as_dict(), separators=(',', ':')).encode(),
+            instance.as_json_bytes()
+        )
+
+    def test_dump_many__should_write_json_array(self):
+        instances = [self.make_instance() for _ in range(5)]
+        buffer = io.BytesIO()
+
+        serializer.dump_many(instances, buffer, chunk_size=2)
+
+        self.assertEqual([instance.as_dict() | {'attr_02': {'example_key': [1.5, None, True], '2': 'example_value'}}
+                          for instance in instances], json.loads(buffer.getvalue()))
+
+        buffer = io.BytesIO()
+        instances[0].dump_to(buffer)
+        self.assertEqual(instances[0].as_json_bytes(), buffer.getvalue())
+
+
+@dataclass
+class NestedDataclassForReverse(NonBlockingValidationDataclass):
+    nested_attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_05'})
+    nested_attr_02: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+
+
+@dataclass
+class DataclassForReverse(NonBlockingValidationDataclass):
+    attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+    attr_02: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'attr_01'})
+    attr_03: int = field(default=None, metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_06'})
+    attr_04: NestedDataclassForReverse = None
+
+
+class TestReverseSerialization(TestCase):
+    def test_to_dict__should_return_flat_input_shape(self):
+        data = {
+            'attr_01': 'example string',
+            'attr_05': 5,
+            'attr_06': 3,
+            'attr_07': {'example_key': 'example_value'},
+            'nested_attr_02': 'nested string',
+        }
+
+        result = DataclassForReverse.from_dict(data)
+
+        self.assertEqual(
+            {'attr_01': 'example string', 'attr_06': 3, 'attr_05': 5, 'nested_attr_02': 'nested string'},
+            result.to_dict()
+        )
+        self.assertEqual(json.dumps(result.to_dict(), separators=(',', ':')).encode(), result.to_json_bytes())
+
+    def test_dump_many_flat__should_write_json_array_of_flat_dicts(self):
+        instances = [DataclassForReverse(attr_01='example string', attr_02='example string', attr_03=number)
+                     for number in range(3)]
+        buffer = io.BytesIO()
+
+        serializer.dump_many(instances, buffer, flat=True)
+
+        self.assertEqual([instance.to_dict() for instance in instances], json.loads(buffer.getvalue()))
+        self.assertEqual({'attr_01': 'example string', 'attr_06': 0}, instances[0].to_dict())
+
+
+@dataclass
+class NestedDataclassForRouting(NonBlockingValidationDataclass):
+    nested_attr_01: int = field(metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_02'})
+    nested_attr_02: str = field(default=None, metadata={'validator': StringFieldValidator(max_length=5)})
+
+
+@dataclass
+class DataclassForRouting(NonBlockingValidationDataclass, codegen=True):
+    attr_01: NestedDataclassForRouting
+    attr_02: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+    attr_03: NestedDataclassForRouting = None
+
+
+class TestNestedConstruction(TestCase):
+    @staticmethod
+    def extract_verbose_errors_from_exception_groups(context):
+        return tuple(exc.args[0] for exc in context.exception.exceptions)
+
+    def test_routing_index__shared_input_keys__should_be_read_once(self):
+        plan = DataclassForRouting._get_validation_plan()
+
+        self.assertEqual(['attr_02', 'nested_attr_02'], [input_key for input_key, _ in plan.routes])
+        self.assertEqual(
+            ['attr_01.nested_attr_01', 'attr_02', 'attr_03.nested_attr_01'],
+            [leaf.path for leaf in plan.routes[0][1]]
+        )
+        self.assertEqual(3, len(plan.nodes))
+
+    def test_from_dict__should_build_every_nested_dataclass(self):
+        result = DataclassForRouting.from_dict({'attr_02': 1, 'nested_attr_02': 'abc'})
+        interpreted_result = NonBlockingValidationDataclass.from_dict.__func__(
+            DataclassForRouting, {'attr_02': 1, 'nested_attr_02': 'abc'}
+        )
+
+        self.assertIn('from_dict', codegen.get_generated_source(DataclassForRouting))
+        expected_nested = NestedDataclassForRouting(nested_attr_01=1, nested_attr_02='abc')
+        self.assertEqual(DataclassForRouting(attr_01=expected_nested, attr_02=1, attr_03=expected_nested), result)
+        self.assertEqual(result, interpreted_result)
+        self.assertIsNot(result.attr_01, result.attr_03)
+
+    def test_from_dict__nested_validation_errors(self):
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassForRouting.from_dict({'attr_02': 'example string', 'nested_attr_02': 'example string'})
+
+        self.assertEqual(
+            ("Field: attr_01.nested_attr_01 raised ValidationError. Value: 'example string' is not of type: "
+             "<class 'int'>",
+             "Field: attr_02 raised ValidationError. Value: 'example string' is not of type: <class 'int'>",
+             "Field: attr_03.nested_attr_01 raised ValidationError. Value: 'example string' is not of type: "
+             "<class 'int'>",
+             "Field: attr_01.nested_attr_02 raised ValidationError. Value: 'example string' is longer than 5",
+             "Field: attr_03.nested_attr_02 raised ValidationError. Value: 'example string' is longer than 5"),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+
+    def test_from_dict__nested_errors_should_keep_field_path(self):
+        dict_data = {'attr_02': 'example string', 'nested_attr_02': 'abcdef'}
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassForRouting.from_dict(dict_data)
+
+        detail = drf.to_drf_validation_error(context.exception).detail
+        _, plan_errors = DataclassForRouting._get_validation_plan().run(dict_data)
+
+        # attr_02 is read by the top level field and by nested_attr_01 of both nested dataclasses
+        self.assertEqual(['attr_01.nested_attr_01', 'attr_01.nested_attr_02', 'attr_02', 'attr_03.nested_attr_01',
+                          'attr_03.nested_attr_02'], sorted(detail))
+        self.assertEqual([path for path, _ in plan_errors], [error.field for error in context.exception.exceptions])
+
+    def test_from_dicts__nested_errors_indexed_by_field_path(self):
+        data = {
+            'attr_02': 1,
+            'attr_03': {'example_key': 'example_value'},
+            'attr_04': 'example string',
+            'nested_attr_02': 2,
+            'inner_nested_attr_01': 3,
+            'inner_nested_attr_02': {'example_key': 'example_value'},
+            'inner_nested_attr_03': 4,
+        }
+
+        result = Dataclass01.from_dicts([data])
+
+        self.assertEqual(
+            {0: {
+                'attr_01.nested_attr_01.inner_nested_attr_03': [
+                    "Field type: <class 'int'> does not match custom AttrValidator type: <class 'str'>",
+                    "Field: attr_01.nested_attr_01.inner_nested_attr_03 raised ValidationError. Value: '4' is not "
+                    "of type: <class 'str'>",
+                ],
+            }},
+            result.errors_by_row()
+        )
+
+
+class TestBenchmark(TestCase):
+    def test_generated_schema_validates_generated_rows(self):
+        config = benchmark.SchemaConfig(width=4, depth=3, mix='range')
+        schema = benchmark.make_schema(config)
+        rows = benchmark.make_rows(config, 50, invalid_ratio=0.5)
+
+        result = schema.from_dicts(rows)
+
+        self.assertTrue(result.errors)
+        valid_rows = [row for index, row in enumerate(rows) if index not in result.invalid_rows]
+        self.assertEqual(valid_rows, [instance.to_dict() for instance in result.instances])
+
+    def test_run_and_compare(self):
+        results = benchmark.run_benchmarks(widths=(3,), depths=(1, 2), rows_count=20, repeat=1)
+        self.assertEqual(16, len(results['results']))
+        for result in results['results']:
+            self.assertGreater(result['ops_per_sec'], 0)
+            if result['name'].startswith(('from_dict[', 'as_dict[', 'as_json_bytes[', 'json.dumps(as_dict)[')):
+                self.assertLessEqual(result['p50_us'], result['p99_us'])
+            else:
+                self.assertIsNone(result['p99_us'])
+        json.dumps(results)
+
+        baseline = json.loads(json.dumps(results))
+        baseline['results'][0]['ops_per_sec'] = results['results'][0]['ops_per_sec'] * 2
+        baseline['results'][1]['p99_us'] = results['results'][1]['p99_us'] / 2
+        baseline['results'][6]['peak_memory_kb'] = results['results'][6]['peak_memory_kb'] / 2
+        comparison = benchmark.compare(results, baseline, threshold=0.1)
+        self.assertEqual(16, len(comparison))
+        self.assertEqual([['ops_per_sec'], ['p99_us']] + [[]] * 4 + [['peak_memory_kb']] + [[]] * 9,
+                         [row['regressions'] for row in comparison])
+        self.assertIn('REGRESSION (p99_us)', benchmark.format_comparison(comparison))
+
+
+@dataclass
+class DataclassForInstrumentation(NonBlockingValidationDataclass, codegen=True):
+    attr_02: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+    attr_04: str = field(default=None, metadata={'validator': StringFieldValidator(max_length=3)})
+    attr_03: NestedDataclassForRouting = None
+
+
+class TestInstrumentation(TestCase):
+    def tearDown(self):
+        instrumentation.uninstrument(DataclassForInstrumentation)
+
+    def test_instrument__should_record_calls_and_fields(self):
+        stats = instrumentation.instrument(DataclassForInstrumentation)
+
+        instance = DataclassForInstrumentation.from_dict({'attr_02': 1, 'attr_04': 'abc', 'nested_attr_02': 'x'})
+        with self.assertRaises(ValidationExceptionGroup):
+            DataclassForInstrumentation.from_dict({'attr_02': 1, 'attr_04': 'abcd', 'nested_attr_02': 'x'})
+        instance.as_dict()
+
+        from_dict_stats = stats.calls[DataclassForInstrumentation, 'from_dict']
+        self.assertEqual((2, 1, 3), (from_dict_stats.calls, from_dict_stats.failures, from_dict_stats.max_payload_size))
+        self.assertEqual(1, stats.calls[DataclassForInstrumentation, 'as_dict'].calls)
+        self.assertEqual(
+            {'attr_02': (2, 0), 'attr_03.nested_attr_01': (2, 0), 'attr_04': (2, 1), 'attr_03.nested_attr_02': (2, 0)},
+            {path: (counter.calls, counter.failures) for (_, path), counter in stats.fields.items()}
+        )
+        self.assertGreater(stats.fields[DataclassForInstrumentation, 'attr_04'].max_time, 0)
+        self.assertEqual(4, len(stats.slowest_fields()))
+        json.dumps(stats.as_dict())
+
+    def test_uninstrument__should_restore_plan_and_generated_methods(self):
+        plan = DataclassForInstrumentation._get_validation_plan()
+        generated_source = codegen.get_generated_source(DataclassForInstrumentation)
+        self.assertIn('from_dict', generated_source)
+
+        instrumentation.instrument(DataclassForInstrumentation)
+        self.assertIsNot(plan, DataclassForInstrumentation._get_validation_plan())
+        self.assertEqual({}, codegen.get_generated_source(DataclassForInstrumentation))
+
+        instrumentation.uninstrument(DataclassForInstrumentation)
+        self.assertIs(plan, DataclassForInstrumentation._get_validation_plan())
+        self.assertEqual(generated_source, codegen.get_generated_source(DataclassForInstrumentation))
+        self.assertFalse(instrumentation.is_instrumented(DataclassForInstrumentation))
+
+    def test_sampling_and_callback_sink(self):
+        events = []
+        instrumentation.instrument(DataclassForInstrumentation, instrumentation.CallbackSink(events.append), 0.5)
+
+        with mock.patch('instrumentation.random.random', side_effect=[0.9, 0.1]):
+            DataclassForInstrumentation.from_dict({'attr_02': 1, 'attr_04': 'a', 'nested_attr_02': 'x'})
+            DataclassForInstrumentation.from_dict({'attr_02': 1, 'attr_04': 'a', 'nested_attr_02': 'x'})
+
+        self.assertEqual(
+            ['attr_02', 'attr_03.nested_attr_01', 'attr_04', 'attr_03.nested_attr_02', None],
+            [event.field for event in events]
+        )
+        self.assertEqual({DataclassForInstrumentation}, {event.cls for event in events})
+        with self.assertRaises(ValueError):
+            instrumentation.instrument(DataclassForInstrumentation, sample_rate=0)
+
+    def test_sink_without_record__should_fail_on_creation(self):
+        class IncompleteSink(instrumentation.Sink):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteSink()
+
+    def test_logging_sink(self):
+        instrumentation.instrument(DataclassForInstrumentation, instrumentation.LoggingSink(slow_threshold=60))
+
+        with self.assertLogs('non_blocking_meta_validation_dataclass', 'DEBUG') as logs:
+            with self.assertRaises(ValidationExceptionGroup):
+                DataclassForInstrumentation.from_dict({'attr_02': 1, 'attr_04': 'abcd', 'nested_attr_02': 'x'})
+
+        self.assertEqual(2, len(logs.output))
+        self.assertIn('DataclassForInstrumentation.from_dict attr_04', logs.output[0])
+        self.assertIn('failed, payload size 3', logs.output[1])
+
+
+@dataclass
+class DataclassForCache(NonBlockingValidationDataclass, codegen=True):
+    attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+    attr_02: dict = field(default=None, metadata={'validator': DictFieldValidator(nullable=True)})
+
+
+class NonCacheableIntFieldValidator(BasicIntFieldValidator):
+    cacheable = False
+
+
+class NonCacheableIntItemValidator(IntFieldValidator):
+    cacheable = False
+
+
+@dataclass
+class NonCacheableDataclassForCache(NonBlockingValidationDataclass):
+    attr_01: int = field(default=None, metadata={'validator': NonCacheableIntFieldValidator})
+    attr_02: Optional[list[int]] = field(default=None, metadata={'item_validator': NonCacheableIntItemValidator()})
+
+
+@dataclass(frozen=True)
+class FrozenDataclassForCache(NonBlockingValidationDataclass):
+    attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+    attr_02: dict = field(default=None, metadata={'validator': DictFieldValidator(nullable=True)})
+
+
+class TestValidationCache(TestCase):
+    def tearDown(self):
+        for cls in (DataclassForCache, NonCacheableDataclassForCache, FrozenDataclassForCache):
+            cache.disable_cache(cls)
+
+    def test_cache__should_ignore_keys_unknown_to_schema(self):
+        validation_cache = cache.enable_cache(DataclassForCache)
+
+        first = DataclassForCache.from_dict({'attr_01': 1, 'attr_02': {'a': [1]}, 'attr_07': 1})
+        second = DataclassForCache.from_dict({'attr_02': {'a': [1]}, 'attr_01': 1, 'attr_07': 2})
+        DataclassForCache.from_dict({'attr_01': True, 'attr_02': {'a': [1]}})
+
+        self.assertEqual(first, second)
+        self.assertEqual((1, 2, 2), validation_cache.info()[:2] + (validation_cache.info().currsize,))
+
+    def test_cache__should_return_copies_of_mutable_instances(self):
+        cache.enable_cache(DataclassForCache)
+        dict_data = {'attr_01': 1, 'attr_02': {'a': [1]}}
+
+        first = DataclassForCache.from_dict(dict_data)
+        first.attr_02['a'].append(2)
+        first.attr_01 = 5
+        dict_data['attr_02']['b'] = 1
+        second = DataclassForCache.from_dict({'attr_01': 1, 'attr_02': {'a': [1]}})
+
+        self.assertIsNot(first, second)
+        self.assertEqual(DataclassForCache(attr_01=1, attr_02={'a': [1]}), second)
+
+    def test_cache__should_share_frozen_instances_of_atomic_values_only(self):
+        cache.enable_cache(FrozenDataclassForCache)
+
+        first = FrozenDataclassForCache.from_dict({'attr_01': 1, 'attr_02': None})
+        self.assertIs(first, FrozenDataclassForCache.from_dict({'attr_01': 1, 'attr_02': None}))
+
+        first = FrozenDataclassForCache.from_dict({'attr_01': 1, 'attr_02': {'k': 1}})
+        first.attr_02['k'] = 999
+        second = FrozenDataclassForCache.from_dict({'attr_01': 1, 'attr_02': {'k': 1}})
+        self.assertIsNot(first, second)
+        self.assertEqual({'k': 1}, second.attr_02)
+
+    def test_cache__should_not_cache_errors(self):
+        validation_cache = cache.enable_cache(DataclassForCache)
+
+        for _ in range(2):
+            with self.assertRaises(ValidationExceptionGroup):
+                DataclassForCache.from_dict({'attr_01': 'a', 'attr_02': None})
+
+        self.assertEqual((0, 2, 0), (validation_cache.hits, validation_cache.misses, validation_cache.info().currsize))
+
+    def test_cache__lru_and_ttl_eviction(self):
+        validation_cache = cache.enable_cache(DataclassForCache, maxsize=2, ttl=10)
+
+        with mock.patch('cache.time.monotonic', return_value=100):
+            for value in (1, 2, 1, 3):
+                DataclassForCache.from_dict({'attr_01': value, 'attr_02': None})
+            self.assertEqual(
+                [((int, 1),), ((int, 3),)], [key[:1] for key in validation_cache.entries]
+            )
+            self.assertEqual(1, validation_cache.evictions)
+
+        with mock.patch('cache.time.monotonic', return_value=110):
+            DataclassForCache.from_dict({'attr_01': 3, 'attr_02': None})
+
+        self.assertEqual((1, 4), (validation_cache.hits, validation_cache.misses))
+
+    def test_cache__should_be_bypassed(self):
+        non_cacheable = cache.enable_cache(NonCacheableDataclassForCache)
+        NonCacheableDataclassForCache.from_dict({'attr_01': 1, 'attr_02': None})
+        NonCacheableDataclassForCache.from_dict({'attr_01': 1, 'attr_02': None})
+        self.assertEqual((0, 0, 2), non_cacheable.info()[:3])
+
+        # Item validators of collection fields count as well
+        with mock.patch.object(NonCacheableIntFieldValidator, 'cacheable', True):
+            non_cacheable = cache.enable_cache(NonCacheableDataclassForCache)
+        NonCacheableDataclassForCache.from_dict({'attr_01': 1, 'attr_02': [1]})
+        NonCacheableDataclassForCache.from_dict({'attr_01': 1, 'attr_02': [1]})
+        self.assertEqual((0, 0, 2), non_cacheable.info()[:3])
+
+        validation_cache = cache.enable_cache(DataclassForCache)
+        DataclassForCache.from_dict({'attr_01': 1, 'attr_02': {'a': {1, 2}}})
+        self.assertEqual((0, 0, 1), validation_cache.info()[:3])
+
+
+class TestPartialUpdate(TestCase):
+    dict_data = {'attr_02': 1, 'nested_attr_02': 'abc'}
+
+    @staticmethod
+    def extract_verbose_errors_from_exception_groups(context):
+        return tuple(exc.args[0] for exc in context.exception.exceptions)
+
+    def test_update_from_dict__should_validate_delta_keys_only(self):
+        instance = DataclassForRouting.from_dict(self.dict_data)
+
+        with mock.patch.object(StringFieldValidator, 'validate') as validate:
+            instance.update_from_dict({'attr_02': 2, 'attr_07': 'unknown'})
+
+        validate.assert_not_called()
+        self.assertEqual((2, 2, 2), (instance.attr_02, instance.attr_01.nested_attr_01, instance.attr_03.nested_attr_01))
+        self.assertEqual(
+            {'attr_02', 'attr_01.nested_attr_01', 'attr_03.nested_attr_01'}, instance.get_dirty_fields()
+        )
+
+    def test_update_from_dict__should_apply_all_or_nothing(self):
+        instance = DataclassForRouting.from_dict(self.dict_data)
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            instance.update_from_dict({'attr_02': 5, 'nested_attr_02': 'abcdef'})
+
+        self.assertEqual(
+            ("Field: attr_01.nested_attr_02 raised ValidationError. Value: 'abcdef' is longer than 5",
+             "Field: attr_03.nested_attr_02 raised ValidationError. Value: 'abcdef' is longer than 5"),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+        self.assertEqual((1, 1, 'abc'), (instance.attr_02, instance.attr_01.nested_attr_01,
+                                         instance.attr_01.nested_attr_02))
+        self.assertEqual(set(), instance.get_dirty_fields())
+
+    def test_update_from_dict__should_report_unset_nested_dataclass(self):
+        instance = DataclassForRouting(attr_01=None, attr_02=1)
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            instance.update_from_dict({'nested_attr_02': 'a'})
+
+        self.assertEqual(
+            ("Field: nested_attr_02 can not be updated, attr_01 is not set",
+             "Field: nested_attr_02 can not be updated, attr_03 is not set"),
+            self.extract_verbose_errors_from_exception_groups(context)
+        )
+
+    def test_dirty_only_export(self):
+        instance = DataclassForRouting.from_dict(self.dict_data)
+        self.assertEqual({}, instance.as_dict(dirty_only=True))
+
+        instance.update_from_dict({'nested_attr_02': 'xy'})
+
+        self.assertEqual(
+            {'attr_01': {'nested_attr_02': 'xy'}, 'attr_03': {'nested_attr_02': 'xy'}}, instance.as_dict(dirty_only=True)
+        )
+        self.assertEqual({'nested_attr_02': 'xy'}, instance.to_dict(dirty_only=True))
+        self.assertEqual({'attr_02': 1, 'nested_attr_02': 'xy'}, instance.to_dict())
+
+        instance.clear_dirty_fields()
+        self.assertEqual(set(), instance.get_dirty_fields())
+        self.assertEqual({}, instance.to_dict(dirty_only=True))
+
+
+@dataclass
+class DataclassForColumns(NonBlockingValidationDataclass):
+    attr_01: int = field(default=None, metadata={'validator': IntFieldValidator(min_value=0, max_value=10)})
+    attr_02: str = field(default=None, metadata={'validator': StringFieldValidator(nullable=True, max_length=3)})
+    attr_03: float = field(default=None, metadata={'validator': FloatFieldValidator(nullable=True, min_value=0.0)})
+    attr_04: dict = field(default=None, metadata={'validator': BasicDictFieldValidator, 'input_field': 'attr_05'})
+
+
+class TestColumnarValidation(TestCase):
+    rows = [
+        {'attr_01': 1, 'attr_02': 'a', 'attr_03': 0.5, 'attr_05': {}},
+        {'attr_01': 11, 'attr_02': 'abcd', 'attr_03': -1.0, 'attr_05': {}},
+        {'attr_01': 10, 'attr_02': None, 'attr_03': None, 'attr_05': []},
+        {'attr_01': 0, 'attr_02': 'abc', 'attr_03': 2.0, 'attr_05': {'a': 1}},
+    ]
+
+    def get_columns(self, numpy_columns: bool) -> dict:
+        columns = {key: [row[key] for row in self.rows] for key in self.rows[0]}
+        if numpy_columns:
+            columns['attr_01'] = np.array(columns['attr_01'])
+            columns['attr_05'] = np.array(columns['attr_05'], dtype=object)
+        return columns
+
+    def assert_matches_from_dicts(self, result):
+        batch_result = DataclassForColumns.from_dicts(self.rows)
+        self.assertEqual(batch_result.rows, list(result.valid_rows))
+        self.assertEqual({'attr_01': [1], 'attr_02': [1], 'attr_03': [1], 'attr_05': [2]},
+                         {key: list(rows) for key, rows in result.errors.items()})
+
+    @skipUnless(np, "NumPy is not installed")
+    def test_from_columns__numpy_columns(self):
+        columns = self.get_columns(numpy_columns=True)
+
+        result = DataclassForColumns.from_columns(columns, build_instances=True)
+
+        self.assert_matches_from_dicts(result)
+        self.assertEqual(DataclassForColumns.from_dicts(self.rows).instances, result.instances)
+        self.assertIs(int, type(result.instances[0].attr_01))
+        self.assertEqual([1, 0], list(result.select(columns)['attr_01']))
+        self.assertEqual(['abcd', None], result.select(columns, valid=False)['attr_02'])
+
+    @skipUnless(np, "NumPy is not installed")
+    def test_from_columns__vectorized_checks(self):
+        result = DataclassForColumns.from_columns({
+            'attr_01': np.array([-1, 5, 11]),
+            'attr_02': np.array(['a', 'abc', 'abcd']),
+            'attr_03': np.array([np.nan, -0.5, 1.0]),
+            'attr_05': np.array([{}, {}, {}], dtype=object),
+        })
+
+        self.assertEqual([False, False, False], list(result.mask))
+        self.assertEqual({'attr_01': [0, 2], 'attr_02': [2], 'attr_03': [1]},
+                         {key: list(rows) for key, rows in result.errors.items()})
+
+        result = DataclassForColumns.from_columns({
+            'attr_01': np.array([1.0, 2.0]), 'attr_02': ['a', 'b'], 'attr_03': [None, 1], 'attr_05': [{}, {}],
+        })
+        self.assertEqual({'attr_01': [0, 1], 'attr_03': [1]}, {key: list(rows) for key, rows in result.errors.items()})
+
+    @skipUnless(np, "NumPy is not installed")
+    def test_from_columns__numpy_columns__custom_validators(self):
+        class PositiveIntFieldValidator(AttrValidator):
+            type = int
+
+            def __call__(self, *args, **kwargs):
+                super().__call__(self.type)
+                if self.value <= 0:
+                    raise FieldError(self.field_name, 'invalid', self.value, {'message': 'Value is not positive'})
+
+        class HalfFloatFieldValidator(FloatFieldValidator):
+            def validate(self, value, field_name: str):
+                super().validate(value, field_name)
+                if value > 0.5:
+                    raise FieldError(field_name, 'invalid', value, {'message': 'Value is greater than 0.5'})
+
+        @dataclass
+        class DataclassForCustomColumns(NonBlockingValidationDataclass):
+            attr_01: int = field(default=None, metadata={'validator': PositiveIntFieldValidator})
+            attr_02: bool = field(default=None, metadata={'validator': FieldValidator(bool)})
+            attr_03: float = field(default=None, metadata={'validator': HalfFloatFieldValidator()})
+
+        columns = {'attr_01': [1, 0, 3], 'attr_02': [True, False, True], 'attr_03': [0.1, 0.2, 0.7]}
+        numpy_columns = {key: np.array(column) for key, column in columns.items()}
+
+        result = DataclassForCustomColumns.from_columns(numpy_columns, build_instances=True)
+
+        self.assertEqual([True, False, False], list(result.mask))
+        self.assertEqual({'attr_01': [1], 'attr_03': [2]}, {key: list(rows) for key, rows in result.errors.items()})
+        self.assertEqual(list(DataclassForCustomColumns.from_columns(columns).mask), list(result.mask))
+        self.assertEqual([DataclassForCustomColumns(1, True, 0.1)], result.instances)
+
+    def test_from_columns__without_numpy(self):
+        with mock.patch('columnar.np', None), mock.patch('columnar._numpy_imported', True):
+            result = DataclassForColumns.from_columns(self.get_columns(numpy_columns=False), build_instances=True)
+
+        self.assertEqual([True, False, False, True], result.mask)
+        self.assert_matches_from_dicts(result)
+        self.assertEqual(DataclassForColumns.from_dicts(self.rows).instances, result.instances)
+
+    def test_from_columns__should_import_numpy_lazily(self):
+        code = ("import sys, non_blocking_meta_validation_dataclass; "
+                "print('columnar' in sys.modules, 'numpy' in sys.modules)")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout
+
+        self.assertEqual('False False', output.strip())
+
+    @skipUnless(np, "NumPy is not installed")
+    def test_get_row__numpy_scalars(self):
+        row = columnar.get_row({'attr_01': np.array([0, 1]), 'attr_02': ['a', 'abcd']}, 1)
+
+        self.assertEqual({'attr_01': 1, 'attr_02': 'abcd'}, row)
+        self.assertIs(int, type(row['attr_01']))
+
+    def test_from_columns__errors(self):
+        with self.assertRaises(ValueError):
+            DataclassForColumns.from_columns({'attr_01': [1], 'attr_02': [], 'attr_03': [], 'attr_05': []})
+        with self.assertRaises(ValidationExceptionGroup):
+            DataclassForColumns.from_columns({'attr_01': [1]})
+
+        self.assertEqual(
+            {'attr_01': 1, 'attr_02': 'abcd'},
+            columnar.get_row({'attr_01': [0, 1], 'attr_02': ['a', 'abcd']}, 1)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenNestedDataclass(NonBlockingValidationDataclass):
+    nested_attr_01: int = field(default=None, metadata={'validator': BasicIntFieldValidator, 'input_field': 'attr_05'})
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSlottedDataclass(NonBlockingValidationDataclass, codegen=True):
+    attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+    attr_02: int = field(default=None, init=False, metadata={'validator': BasicIntFieldValidator})
+    attr_03: FrozenNestedDataclass = None
+
+    @property
+    def attr_01_upper(self):
+        return self.attr_01.upper()
+
+
+@dataclass(slots=True)
+class SlottedDataclass(NonBlockingValidationDataclass):
+    attr_01: str = field(default=None, metadata={'validator': BasicStringFieldValidator})
+    attr_02: int = field(default=None, init=False, metadata={'validator': BasicIntFieldValidator})
+    attr_03: NestedDataclassForReverse = None
+
+
+class TestSlottedAndFrozenDataclasses(TestCase):
+    dict_data = {'attr_01': 'abc', 'attr_02': 2, 'attr_05': 5, 'nested_attr_02': 'x'}
+
+    def test_frozen_slotted__from_dict(self):
+        for _ in range(2):
+            # Second call runs generated from_dict / as_dict
+            instance = FrozenSlottedDataclass.from_dict(self.dict_data)
+
+            self.assertFalse(hasattr(instance, '__dict__'))
+            self.assertEqual(('abc', 2, 5), (instance.attr_01, instance.attr_02, instance.attr_03.nested_attr_01))
+            self.assertEqual(
+                {'attr_01_upper': 'ABC', 'attr_01': 'abc', 'attr_03': {'nested_attr_01': 5}}, instance.as_dict()
+            )
+            self.assertEqual({'attr_01': 'abc', 'attr_02': 2, 'attr_05': 5}, instance.to_dict())
+        self.assertIn('from_dict', codegen.get_generated_source(FrozenSlottedDataclass))
+
+        with self.assertRaises(FrozenInstanceError):
+            instance.attr_01 = 'a'
+        with self.assertRaises(FrozenInstanceError):
+            instance.update_from_dict({'attr_05': 1})
+        self.assertEqual(5, instance.attr_03.nested_attr_01)
+
+    def test_slotted__update_from_dict(self):
+        instance = SlottedDataclass.from_dict(self.dict_data)
+        self.assertFalse(hasattr(instance, '__dict__'))
+
+        instance.update_from_dict({'attr_02': 3, 'attr_05': 6})
+
+        self.assertEqual({'attr_02', 'attr_03.nested_attr_01'}, instance.get_dirty_fields())
+        self.assertEqual({'attr_02': 3, 'attr_05': 6}, instance.to_dict(dirty_only=True))
+
+    def test_cache__should_return_frozen_instances_as_is(self):
+        cache.enable_cache(FrozenSlottedDataclass)
+        try:
+            first = FrozenSlottedDataclass.from_dict(self.dict_data)
+            self.assertIs(first, FrozenSlottedDataclass.from_dict(self.dict_data))
+        finally:
+            cache.disable_cache(FrozenSlottedDataclass)
+
+
+class TestRecordStore(TestCase):
+    rows = [
+        {'attr_01': 'a', 'attr_02': 1, 'attr_05': 5, 'nested_attr_02': 'x'},
+        {'attr_01': 1, 'attr_02': 1, 'attr_05': 5, 'nested_attr_02': 'x'},
+        {'attr_01': 'b', 'attr_02': 2, 'attr_05': 6, 'nested_attr_02': 'y'},
+    ]
+
+    def test_from_dicts__as_records(self):
+        expected_result = SlottedDataclass.from_dicts(self.rows)
+
+        result = SlottedDataclass.from_dicts(self.rows, as_records=True)
+        store = result.instances
+
+        self.assertIsInstance(store, records.RecordStore)
+        self.assertEqual(([0, 2], [1]), (result.rows, result.invalid_rows))
+        self.assertEqual(['a', 'b'], store.columns['attr_01'])
+        self.assertEqual(2, len(store))
+        self.assertEqual(('b', 2, 6), (store[-1].attr_01, store[-1].attr_02, store[-1].attr_03.nested_attr_01))
+        self.assertEqual(expected_result.instances, list(store))
+        self.assertEqual(expected_result.instances, store.to_instances())
+        self.assertEqual([instance.as_dict() for instance in expected_result.instances],
+                         [view.as_dict() for view in store])
+        self.assertEqual(self.rows[2], store[1].to_dict())
+        with self.assertRaises(AttributeError):
+            store[0].attr_01 = 'c'
+        with self.assertRaises(IndexError):
+            store[2]
+        self.assertEqual(expected_result.instances[1:], store[1:])
+
+    def test_record_views__methods_and_json(self):
+        store = SlottedDataclass.from_dicts(self.rows, as_records=True).instances
+        instances = store.to_instances()
+
+        self.assertEqual(instances[0].as_json_bytes(), store[0].as_json_bytes())
+        self.assertEqual(instances[0].to_json_bytes(), store[0].to_json_bytes())
+        self.assertEqual(set(), store[0].get_dirty_fields())
+        self.assertEqual(serializer.dumps(instances[1]), serializer.dumps(store[1]))
+
+        for flat in (False, True):
+            buffer, expected_buffer = io.BytesIO(), io.BytesIO()
+            serializer.dump_many(store, buffer, flat=flat)
+            serializer.dump_many(instances, expected_buffer, flat=flat)
+            self.assertEqual(expected_buffer.getvalue(), buffer.getvalue())
+
+    def test_from_dicts__as_records__frozen_class_and_properties(self):
+        store = FrozenSlottedDataclass.from_dicts(self.rows, as_records=True).instances
+
+        self.assertEqual('B', store[1].attr_01_upper)
+        self.assertEqual(FrozenSlottedDataclass.from_dict(self.rows[2]), store[1].to_instance())
+
+    def test_record_views__eq_and_hash(self):
+        store = FrozenSlottedDataclass.from_dicts(self.rows + self.rows, as_records=True).instances
+
+        self.assertEqual(store[0], store[2])
+        self.assertNotEqual(store[0], store[1])
+        self.assertEqual(store[0].to_instance(), store[0])
+        self.assertEqual(2, len(set(store)))
+        self.assertEqual(hash(store[0].to_instance()), hash(store[0]))
+        with self.assertRaises(TypeError):
+            hash(SlottedDataclass.from_dicts(self.rows, as_records=True).instances[0])
+
+    def test_from_dicts__as_records__workers(self):
+        # Small batches are validated in process, chunks are sent to the executor above the limit only
+        with ThreadPoolExecutor(2) as executor, mock.patch('batch.PARALLEL_MIN_ROWS', 0), \
+                mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+            result = SlottedDataclass.from_dicts(self.rows * 10, workers=2, chunk_size=4, executor=executor,
+                                                 as_records=True)
+
+        self.assertEqual(8, submit.call_count)
+        self.assertEqual(20, len(result.instances))
+        self.assertEqual(SlottedDataclass.from_dicts(self.rows * 10).instances, list(result.instances))
+
+
+@dataclass
+class ItemDataclass(NonBlockingValidationDataclass):
+    name: str = field(default=None, metadata={'validator': BasicStringFieldValidator, 'input_field': 'name'})
+    price: int = field(default=None, metadata={'validator': IntFieldValidator(min_value=0), 'input_field': 'price'})
+
+
+@dataclass
+class DataclassWithCollections(NonBlockingValidationDataclass):
+    ids: list[int] = field(default=None, metadata={'input_field': 'ids'})
+    items: list[ItemDataclass] = field(default=None, metadata={'input_field': 'items', 'max_errors': 3})
+    tags: tuple[str, ...] = field(default=None, metadata={'input_field': 'tags'})
+    counts: dict[str, int] = field(default=None, metadata={'input_field': 'counts'})
+    scores: Optional[list[int]] = field(default=None, metadata={
+        'validator': FieldValidator(list, nullable=True), 'item_validator': IntFieldValidator(max_value=100),
+        'input_field': 'scores',
+    })
+    by_name: dict[str, ItemDataclass] = field(default=None, metadata={'input_field': 'by_name'})
+    item: Optional[ItemDataclass] = None
+
+
+@dataclass
+class CodegenDataclassWithCollections(DataclassWithCollections, codegen=True):
+    pass
+
+
+class TestCollectionFields(TestCase):
+    valid_data = {
+        'ids': [1, 2, True], 'items': [{'name': 'a', 'price': 1}], 'tags': ['x', 'y'], 'counts': {'a': 1},
+        'scores': None, 'by_name': {'b': {'name': 'b', 'price': 2}}, 'name': 'c', 'price': 3,
+    }
+
+    def get_errors(self, cls, **data) -> dict:
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            cls.from_dict({**self.valid_data, **data})
+        return {error.field: error.code for error in context.exception.exceptions}
+
+    def test_get_field_type(self):
+        field_types = {
+            dataclass_field.name: DataclassWithCollections._get_field_type(dataclass_field)
+            for dataclass_field in fields(DataclassWithCollections)
+        }
+
+        self.assertEqual({'ids': list, 'items': list, 'tags': tuple, 'counts': dict, 'scores': list, 'by_name': dict,
+                          'item': ItemDataclass}, field_types)
+
+    def test_from_dict(self):
+        for cls in (DataclassWithCollections, CodegenDataclassWithCollections):
+            with self.subTest(cls=cls.__name__):
+                instance = cls.from_dict(self.valid_data)
+
+                self.assertEqual([1, 2, True], instance.ids)
+                self.assertEqual([ItemDataclass('a', 1)], instance.items)
+                self.assertEqual(('x', 'y'), instance.tags)
+                self.assertEqual({'a': 1}, instance.counts)
+                self.assertIsNone(instance.scores)
+                self.assertEqual({'b': ItemDataclass('b', 2)}, instance.by_name)
+                self.assertEqual(ItemDataclass('c', 3), instance.item)
+
+    def test_from_dict__item_errors(self):
+        for cls in (DataclassWithCollections, CodegenDataclassWithCollections):
+            with self.subTest(cls=cls.__name__):
+                errors = self.get_errors(cls, ids=[1, 'a', None], items=[{'name': 'a', 'price': 1}, {'name': 'b', 'price': -1}],
+                                         tags=('x', 1), counts={'a': 'b', 1: 2}, scores=[1, 101],
+                                         by_name={'b': {'name': 1, 'price': 2}})
+
+                self.assertEqual({
+                    'ids[1]': 'invalid_type', 'ids[2]': 'invalid_type', 'items[1].price': 'min_value',
+                    'tags[1]': 'invalid_type', 'counts[1]': 'invalid_type', 'scores[1]': 'max_value',
+                    "by_name['b'].name": 'invalid_type',
+                }, errors)
+                self.assertEqual({'ids': 'invalid_type', 'counts': 'invalid_type'},
+                                 self.get_errors(cls, ids=(1, 2), counts=[1]))
+
+    def test_from_dict__max_errors(self):
+        items = [{'name': 'a', 'price': -1}] * 10
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassWithCollections.from_dict({**self.valid_data, 'items': items})
+
+        errors = context.exception.exceptions
+        self.assertEqual(['items[0].price', 'items[1].price', 'items[2].price', 'items'],
+                         [error.field for error in errors])
+        self.assertEqual('too_many_errors', errors[-1].code)
+
+    def test_from_dict__nested_item_missing_key(self):
+        @dataclass
+        class ItemWithoutInputField(NonBlockingValidationDataclass):
+            price: int = field(default=None, metadata={'validator': BasicIntFieldValidator})
+
+        @dataclass
+        class DataclassWithItems(NonBlockingValidationDataclass):
+            items: list[ItemWithoutInputField] = field(default=None, metadata={'input_field': 'items'})
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassWithItems.from_dict({'items': [{'price': 1}, {}]})
+
+        self.assertEqual([('items[1].price', 'missing_key')],
+                         [(error.field, error.code) for error in context.exception.exceptions])
+
+    def test_run__item_paths(self):
+        plan = DataclassWithCollections._get_validation_plan()
+        _, errors = plan.run({**self.valid_data, 'ids': [1, 'a']})
+
+        self.assertEqual(['ids[1]'], [path for path, _ in errors])
+
+    def test_item_type_mismatch_and_missing_validator(self):
+        @dataclass
+        class DataclassWithMismatch(NonBlockingValidationDataclass):
+            attr_01: list[int] = field(default=None, metadata={'validator': BasicDictFieldValidator,
+                                                               'input_field': 'attr_01'})
+            attr_02: Optional[int] = field(default=None, metadata={'validator': IntFieldValidator(nullable=True),
+                                                                   'input_field': 'attr_02'})
+
+        with self.assertRaises(ValidationExceptionGroup) as context:
+            DataclassWithMismatch.from_dict({'attr_01': {}, 'attr_02': None})
+
+        # Optional[int] matches the int validator, list[int] does not match the dict one
+        self.assertEqual([('attr_01', 'type_mismatch')],
+                         [(error.field, error.code) for error in context.exception.exceptions])
+
+    def test_update_from_dict(self):
+        instance = DataclassWithCollections.from_dict(self.valid_data)
+
+        instance.update_from_dict({'items': [{'name': 'b', 'price': 5}], 'tags': ['z']})
+
+        self.assertEqual([ItemDataclass('b', 5)], instance.items)
+        self.assertEqual(('z',), instance.tags)
+        with self.assertRaises(ValidationExceptionGroup):
+            instance.update_from_dict({'ids': ['a']})
+
+    def test_serialization(self):
+        for cls in (DataclassWithCollections, CodegenDataclassWithCollections):
+            with self.subTest(cls=cls.__name__):
+                instance = cls.from_dict(self.valid_data)
+
+                as_dict = instance.as_dict()
+                self.assertEqual([{'name': 'a', 'price': 1}], as_dict['items'])
+                self.assertEqual(['x', 'y'], as_dict['tags'])
+                self.assertEqual({'b': {'name': 'b', 'price': 2}}, as_dict['by_name'])
+                self.assertEqual(self.valid_data, {**instance.to_dict(), 'tags': ['x', 'y']})
+                self.assertEqual(cls.from_dict(json.loads(serializer.dumps_flat(instance))), instance)
+                self.assertEqual(as_dict, json.loads(serializer.dumps(instance)))
+
+    def test_from_columns(self):
+        columns = {key: [value, value] for key, value in self.valid_data.items()}
+        columns['ids'] = [[1, 2, True], [1, 'a']]
+
+        result = DataclassWithCollections.from_columns(columns, build_instances=True)
+
+        self.assertEqual([0], list(result.valid_rows))
+        self.assertEqual({'ids': [1]}, {key: list(rows) for key, rows in result.errors.items()})
+        self.assertEqual([DataclassWithCollections.from_dict(self.valid_data)], result.instances)
+
+    def test_large_arrays(self):
+        ids = list(range(50_000))
+        items = [{'name': 'a', 'price': index} for index in range(50_000)]
+
+        started_at = time.perf_counter()
+        instance = DataclassWithCollections.from_dict({**self.valid_data, 'ids': ids, 'items': items})
+        elapsed = time.perf_counter() - started_at
+
+        self.assertIs(ids, instance.ids)
+        self.assertEqual(50_000, len(instance.items))
+        self.assertLess(elapsed, 5.0)
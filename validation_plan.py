@@ -0,0 +1,570 @@
+import asyncio
+import types
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Optional, Tuple, Type, Union, get_args, get_origin
+
+from errors import FieldError
+from validators import FieldValidator, get_field_validator, is_async_validator
+
+NoneType = type(None)
+# Types of list / tuple fields, tuple[T, ...] is filled from JSON arrays as well
+SEQUENCE_TYPES = (list, tuple)
+
+
+@dataclass(frozen=True)
+class CollectionPlan:
+    """
+    Element validation of list[T], tuple[T, ...] and dict[K, T] fields, resolved once per class.
+    Items are validated by one of:
+    item_check_types - inline isinstance check
+    item_validator   - FieldValidator from 'item_validator' metadata or a validator with options
+    item_plan        - ValidationPlan of nested dataclass T, items are dicts in the input shape of T
+    item_collection  - CollectionPlan of nested collection T, e.g. list[list[int]]
+    Items of Any type are not validated, None items are valid for Optional[T] items.
+    max_errors stops validation of the field after this many item errors.
+    """
+    kind: type
+    item_nullable: bool = False
+    item_check_types: Optional[Tuple[type, ...]] = None
+    item_validator: Optional[FieldValidator] = None
+    item_plan: Optional['ValidationPlan'] = None
+    item_collection: Optional['CollectionPlan'] = None
+    key_types: Optional[Tuple[type, ...]] = None
+    max_errors: Optional[int] = None
+
+    def validate(self, value, path: str) -> Tuple[Any, list]:
+        """
+        Value with validated items, nested dataclass items built, and list of (item path, error) pairs.
+        Item paths are 'items[1234]' or 'items[1234].price', errors get the path as their field.
+        """
+        if value is None:
+            return None, ()
+
+        if self.kind is dict:
+            items = value.items()
+            if self.key_types is not None:
+                key_errors = self._validate_keys(value, path)
+                if key_errors:
+                    return value, key_errors
+        else:
+            # Fast path of plain sequences, type() of every item is collected at C speed
+            check_types = self.item_check_types
+            if check_types is not None and set(map(type, value)).issubset(check_types):
+                return value if value.__class__ is self.kind else self.kind(value), ()
+            items = enumerate(value)
+
+        errors = []
+        converted = {} if self.kind is dict else []
+        for key, item in items:
+            item_errors = self._validate_item(item, path, key, converted)
+            if item_errors:
+                errors.extend(item_errors)
+                if self.max_errors is not None and len(errors) >= self.max_errors:
+                    del errors[self.max_errors:]
+                    errors.append((path, FieldError(path, 'too_many_errors', params={'max_errors': self.max_errors})))
+                    break
+
+        if errors:
+            return value, errors
+        if self.kind is tuple:
+            return tuple(converted), errors
+        return converted, errors
+
+    @property
+    def container_types(self) -> Tuple[type, ...]:
+        return SEQUENCE_TYPES if self.kind is tuple else (self.kind,)
+
+    def _validate_keys(self, value: dict, path: str) -> list:
+        return [
+            (f'{path}[{key!r}]', FieldError(f'{path}[{key!r}]', 'invalid_type', key, {'type': self.key_types[0]}))
+            for key in value if not isinstance(key, self.key_types)
+        ]
+
+    def _validate_item(self, item, path: str, key, converted) -> list:
+        """Validate a single item and add it to converted, return list of (item path, error) pairs."""
+        if item is None and self.item_nullable:
+            pass
+
+        elif self.item_check_types is not None:
+            if not isinstance(item, self.item_check_types):
+                item_path = _item_path(path, key, self.kind)
+                return [(item_path, self.item_validator.type_error(item, item_path))]
+
+        elif self.item_validator is not None:
+            try:
+                self.item_validator.validate(item, path)
+            except FieldError as e:
+                item_path = _item_path(path, key, self.kind)
+                return [(item_path, e.set_field(item_path))]
+
+        elif self.item_plan is not None:
+            if not isinstance(item, dict):
+                item_path = _item_path(path, key, self.kind)
+                return [(item_path, FieldError(item_path, 'invalid_type', item, {'type': dict}))]
+            node_values, item_errors = self.item_plan.run_values(item)
+            if item_errors:
+                item_path = _item_path(path, key, self.kind)
+                return [
+                    (f'{item_path}.{field_path}', _item_error(f'{item_path}.{field_path}', error))
+                    for field_path, error in item_errors
+                ]
+            item = self.item_plan.build_instance(node_values)
+
+        elif self.item_collection is not None:
+            item_path = _item_path(path, key, self.kind)
+            container_types = self.item_collection.container_types
+            if not isinstance(item, container_types):
+                return [(item_path, FieldError(item_path, 'invalid_type', item, {'type': container_types}))]
+            item, item_errors = self.item_collection.validate(item, item_path)
+            if item_errors:
+                return item_errors
+
+        if self.kind is dict:
+            converted[key] = item
+        else:
+            converted.append(item)
+        return []
+
+
+def _item_path(path: str, key, kind: type) -> str:
+    return f'{path}[{key!r}]' if kind is dict else f'{path}[{key}]'
+
+
+def _item_error(item_path: str, error: Exception) -> FieldError:
+    if isinstance(error, FieldError):
+        return error.set_field(item_path)
+    # Formatting error of a nested dataclass item: key without input_field is missing in the item
+    return FieldError(item_path, 'missing_key')
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """
+    Everything from_dict needs to know about a single dataclass field, resolved once per class.
+    validator is FieldValidator from metadata (class based validators adapted), check_types is set for pure type checks
+    which are done inline by isinstance(value, check_types).
+    node and path locate the field in the tree of nested dataclasses of the plan it is routed by.
+    collection validates items of list / tuple / dict fields after validator accepted the value itself.
+    """
+    name: str
+    input_key: str
+    validator: Optional[FieldValidator]
+    field_type: Type
+    type_mismatch: Optional[dict] = None
+    nested: Optional['ValidationPlan'] = None
+    is_async: bool = False
+    check_types: Optional[Tuple[type, ...]] = None
+    init: bool = True
+    node: int = 0
+    path: str = ''
+    collection: Optional[CollectionPlan] = None
+
+
+@dataclass(frozen=True)
+class NodePlan:
+    """
+    Dataclass built by from_dict: root (parent None) or nested dataclass assigned to field_name of parent node.
+    Non init fields of frozen dataclasses are set by object.__setattr__, the same way dataclass __init__ does it.
+    """
+    cls: Type
+    parent: Optional[int] = None
+    field_name: Optional[str] = None
+    non_init_fields: Tuple[str, ...] = ()
+    frozen: bool = False
+
+
+@dataclass(frozen=True)
+class ValidationPlan:
+    """
+    Precompiled validation plan of a NonBlockingValidationDataclass subclass.
+
+    formatting_checks - flattened (depth-first) triples of (field name, error message, input key). Key is None when
+                        the error does not depend on input data, otherwise error is raised only if key is missing
+                        in input data.
+    nodes             - root and all nested dataclasses in depth-first order, every parent precedes its children.
+    leaves            - fields with a validator of the whole tree of nested dataclasses.
+    routes            - routing index: (input key, leaves fed by the key) pairs ordered by first use of the key,
+                        every key is read from input data once and validated for all its leaves.
+    routes_by_key     - the same routing index by input key, for partial updates.
+    async_fields      - paths of leaves with async validators, these are only run by afrom_dict.
+    """
+    cls: Type
+    fields: Tuple[FieldPlan, ...]
+    formatting_checks: Tuple[Tuple[str, str, Optional[str]], ...]
+    nodes: Tuple[NodePlan, ...] = ()
+    leaves: Tuple[FieldPlan, ...] = ()
+    routes: Tuple[Tuple[str, Tuple[FieldPlan, ...]], ...] = ()
+    async_fields: Tuple[str, ...] = ()
+    routes_by_key: dict = field(default_factory=dict)
+
+    def get_formatting_errors(self, dict_data: dict) -> list:
+        """List of (field name, error) pairs."""
+        return [
+            (field_name, AttributeError(message)) for field_name, message, input_key in self.formatting_checks
+            if input_key is None or input_key not in dict_data
+        ]
+
+    def validate(self, dict_data: dict) -> Tuple[list, list]:
+        """
+        Run validators of the plan, return valid values by field name of every node and
+        list of (field path, error) pairs.
+        """
+        if self.async_fields:
+            raise TypeError(f"Fields {', '.join(self.async_fields)} of {self.cls.__name__} have async validators, "
+                            f"use afrom_dict")
+
+        node_values = [{} for _ in self.nodes]
+        validation_errors = []
+
+        for input_key, leaves in self.routes:
+            value = dict_data.get(input_key)
+            for leaf in leaves:
+                if leaf.type_mismatch is not None:
+                    validation_errors.append((leaf.path, FieldError(leaf.path, 'type_mismatch',
+                                                                    params=leaf.type_mismatch)))
+
+                if leaf.check_types is not None:
+                    if not isinstance(value, leaf.check_types):
+                        validation_errors.append((leaf.path, leaf.validator.type_error(value, leaf.path)))
+                        continue
+                else:
+                    try:
+                        leaf.validator.validate(value, leaf.path)
+                    except FieldError as e:
+                        validation_errors.append((leaf.path, e))
+                        continue
+
+                if leaf.collection is None:
+                    node_values[leaf.node][leaf.name] = value
+                else:
+                    items, item_errors = leaf.collection.validate(value, leaf.path)
+                    if item_errors:
+                        validation_errors.extend(item_errors)
+                    else:
+                        node_values[leaf.node][leaf.name] = items
+
+        return node_values, validation_errors
+
+    def validate_delta(self, delta: dict) -> Tuple[list, list]:
+        """
+        Run validators of leaves routed by keys present in delta only, return (leaf, value) pairs of valid values and
+        list of (field path, error) pairs. Keys unknown to the plan are ignored.
+        """
+        updates = []
+        validation_errors = []
+
+        for input_key, value in delta.items():
+            for leaf in self.routes_by_key.get(input_key, ()):
+                if leaf.is_async:
+                    raise TypeError(f"Field {leaf.path} of {self.cls.__name__} has an async validator")
+                if leaf.type_mismatch is not None:
+                    validation_errors.append((leaf.path, FieldError(leaf.path, 'type_mismatch',
+                                                                    params=leaf.type_mismatch)))
+                try:
+                    leaf.validator.validate(value, leaf.path)
+                except FieldError as e:
+                    validation_errors.append((leaf.path, e))
+                    continue
+
+                if leaf.collection is None:
+                    updates.append((leaf, value))
+                else:
+                    items, item_errors = leaf.collection.validate(value, leaf.path)
+                    if item_errors:
+                        validation_errors.extend(item_errors)
+                    else:
+                        updates.append((leaf, items))
+
+        return updates, validation_errors
+
+    def get_node_instance(self, root, node_index: int, node_instances: dict):
+        """Instance of the node in the tree of root, None if a dataclass on the way is not set."""
+        if node_index in node_instances:
+            return node_instances[node_index]
+        node = self.nodes[node_index]
+        if node.parent is None:
+            instance = root
+        else:
+            parent = self.get_node_instance(root, node.parent, node_instances)
+            instance = getattr(parent, node.field_name) if parent is not None else None
+        node_instances[node_index] = instance
+        return instance
+
+    async def avalidate(self, dict_data: dict, concurrency: Optional[int] = None,
+                        timeout: Optional[float] = None) -> Tuple[list, list]:
+        """
+        Same as validate, but async validators of all fields are awaited concurrently.
+        concurrency - max number of async validators running at the same time
+        timeout     - seconds for all async validators of the call, unfinished ones are cancelled and reported
+                      as validation errors
+        Errors are returned in the same order as validate returns them.
+        """
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def run_async_validator(leaf: FieldPlan, value):
+            if semaphore is None:
+                return await leaf.validator.validate(value, leaf.path)
+            async with semaphore:
+                return await leaf.validator.validate(value, leaf.path)
+
+        node_values = [{} for _ in self.nodes]
+        errors_by_leaf = []
+        tasks = {}
+
+        def set_value(leaf: FieldPlan, value, leaf_errors: list):
+            if leaf.collection is None:
+                node_values[leaf.node][leaf.name] = value
+                return
+            items, item_errors = leaf.collection.validate(value, leaf.path)
+            if item_errors:
+                leaf_errors.extend(error for _, error in item_errors)
+            else:
+                node_values[leaf.node][leaf.name] = items
+
+        for input_key, leaves in self.routes:
+            value = dict_data.get(input_key)
+            for leaf in leaves:
+                leaf_errors = []
+                errors_by_leaf.append((leaf, leaf_errors))
+                if leaf.type_mismatch is not None:
+                    leaf_errors.append(FieldError(leaf.path, 'type_mismatch', params=leaf.type_mismatch))
+
+                if leaf.is_async:
+                    tasks[asyncio.ensure_future(run_async_validator(leaf, value))] = (leaf, value, leaf_errors)
+                    continue
+
+                try:
+                    leaf.validator.validate(value, leaf.path)
+                    set_value(leaf, value, leaf_errors)
+                except FieldError as e:
+                    leaf_errors.append(e)
+
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+                leaf, value, leaf_errors = tasks[task]
+                leaf_errors.append(FieldError(leaf.path, 'timeout', value, {'timeout': timeout}))
+            unexpected_error = None
+            for task in done:
+                leaf, value, leaf_errors = tasks[task]
+                error = task.exception()
+                if error is None:
+                    set_value(leaf, value, leaf_errors)
+                elif isinstance(error, FieldError):
+                    leaf_errors.append(error)
+                else:
+                    unexpected_error = unexpected_error or error
+            if pending:
+                await asyncio.wait(pending)
+            if unexpected_error is not None:
+                raise unexpected_error
+
+        validation_errors = [
+            (leaf.path, error) for leaf, leaf_errors in errors_by_leaf for error in leaf_errors
+        ]
+        return node_values, validation_errors
+
+    def run(self, dict_data: dict) -> Tuple[Any, list]:
+        """Non raising from_dict: (instance, []) for valid data or (None, [(field path, error), ...])."""
+        node_values, errors = self.run_values(dict_data)
+        if errors:
+            return None, errors
+
+        return self.build_instance(node_values), errors
+
+    def run_values(self, dict_data: dict) -> Tuple[Optional[list], list]:
+        """Same as run, but valid values of every node are returned instead of the built instance."""
+        errors = self.get_formatting_errors(dict_data)
+        if errors:
+            return None, errors
+
+        node_values, errors = self.validate(dict_data)
+        if errors:
+            return None, errors
+
+        return node_values, errors
+
+    def build_instance(self, node_values: list):
+        """Build every nested dataclass once, children first, and pass it to its parent as a keyword argument."""
+        nodes = self.nodes
+        for index in range(len(nodes) - 1, -1, -1):
+            node = nodes[index]
+            values = node_values[index]
+            non_init_values = [(name, values.pop(name)) for name in node.non_init_fields if name in values]
+            instance = node.cls(**values)
+            set_attribute = object.__setattr__ if node.frozen else setattr
+            for name, value in non_init_values:
+                set_attribute(instance, name, value)
+
+            if node.parent is None:
+                return instance
+            node_values[node.parent][node.field_name] = instance
+
+
+def _is_nested_dataclass(field_type) -> bool:
+    from non_blocking_meta_validation_dataclass import NonBlockingValidationDataclass
+
+    return isinstance(field_type, type) and issubclass(field_type, NonBlockingValidationDataclass)
+
+
+def unwrap_optional(annotation) -> Tuple[Any, bool]:
+    """(T, True) for Optional[T] / T | None, (annotation, False) otherwise."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = get_args(annotation)
+        if len(args) == 2 and NoneType in args:
+            return args[0] if args[1] is NoneType else args[1], True
+    return annotation, False
+
+
+def _build_collection_plan(annotation, metadata) -> Optional[CollectionPlan]:
+    """CollectionPlan of list[T], tuple[T, ...] or dict[K, T] annotation, None for other annotations."""
+    kind = get_origin(annotation)
+    args = get_args(annotation)
+    if kind not in (list, tuple, dict) or not args:
+        return None
+
+    key_types = None
+    if kind is tuple:
+        if len(args) != 2 or args[1] is not Ellipsis:
+            # Fixed length tuples are validated as a whole
+            return None
+        item_type = args[0]
+    elif kind is dict:
+        key_type, item_type = args
+        key_types = (key_type,) if isinstance(key_type, type) and key_type is not object else None
+    else:
+        item_type = args[0]
+    item_type, item_nullable = unwrap_optional(item_type)
+
+    item_validator = None
+    item_plan = None
+    item_collection = None
+    if _is_nested_dataclass(item_type):
+        item_plan = item_type._get_validation_plan()
+    elif metadata.get('item_validator'):
+        item_validator = get_field_validator(metadata['item_validator'])
+        if is_async_validator(item_validator):
+            raise TypeError(f"Async item validator {item_validator!r} is not supported")
+    elif get_origin(item_type) in (list, tuple, dict):
+        item_collection = _build_collection_plan(item_type, {})
+    elif isinstance(item_type, type) and item_type is not object:
+        # Element validator derived from the element type
+        item_validator = FieldValidator(item_type, item_nullable)
+
+    return CollectionPlan(
+        kind=kind,
+        item_nullable=item_nullable,
+        item_check_types=item_validator.check_types if item_validator else None,
+        item_validator=item_validator,
+        item_plan=item_plan,
+        item_collection=item_collection,
+        key_types=key_types,
+        max_errors=metadata.get('max_errors'),
+    )
+
+
+def _collect_tree(field_plans: Tuple[FieldPlan, ...], node: int, path_prefix: str, nodes: list, leaves: list):
+    for field_plan in field_plans:
+        path = path_prefix + field_plan.name
+        if field_plan.nested is not None:
+            nested_plan = field_plan.nested
+            nodes.append(NodePlan(
+                cls=nested_plan.cls,
+                parent=node,
+                field_name=field_plan.name,
+                non_init_fields=nested_plan.nodes[0].non_init_fields,
+                frozen=nested_plan.nodes[0].frozen,
+            ))
+            _collect_tree(nested_plan.fields, len(nodes) - 1, path + '.', nodes, leaves)
+        elif field_plan.validator is not None:
+            leaves.append(replace(field_plan, node=node, path=path))
+
+
+def build_validation_plan(cls) -> ValidationPlan:
+    """Resolve input keys, validators, types and nested dataclasses of cls, the same way from_dict reads them."""
+    field_plans = []
+    formatting_checks = []
+
+    for dataclass_field in fields(cls):
+        field_type = cls._get_field_type(dataclass_field)
+        annotation, optional = unwrap_optional(dataclass_field.type)
+        validator = dataclass_field.metadata.get('validator')
+        input_field = dataclass_field.metadata.get('input_field')
+
+        nested_plan = None
+        collection = None
+        field_validator = None
+        if _is_nested_dataclass(field_type):
+            nested_plan = field_type._get_validation_plan()
+            formatting_checks.extend(nested_plan.formatting_checks)
+        else:
+            collection = _build_collection_plan(annotation, dataclass_field.metadata)
+            if collection is not None and not validator:
+                # Collection fields without a validator only check the container type
+                field_validator = FieldValidator(SEQUENCE_TYPES if field_type is tuple else field_type, optional)
+            item_collection = collection
+            while item_collection is not None:
+                # Schema errors of nested dataclass items, item data errors are reported per item
+                if item_collection.item_plan is not None:
+                    formatting_checks.extend(
+                        check for check in item_collection.item_plan.formatting_checks if check[2] is None
+                    )
+                item_collection = item_collection.item_collection
+
+            name = dataclass_field.name
+            if not validator and field_validator is None:
+                formatting_checks.append((name, f"Field '{name}' has no validator attribute in field metadata", None))
+            if not input_field:
+                formatting_checks.append(
+                    (name, f"Field '{name}' has no input_field attribute in field metadata "
+                           f"and field '{name}' not present in input data.", name)
+                )
+
+        # Typing on dataclass field must match the type included in custom validator if both present,
+        # Optional[T] fields are compared by T and collection fields by the container type
+        type_mismatch = None
+        if validator and dataclass_field.type and nested_plan is None:
+            validator_type = getattr(validator, 'type', None)
+            if validator_type != (field_type if collection is not None else annotation):
+                type_mismatch = {'field_type': dataclass_field.type, 'validator_type': validator_type}
+
+        if validator and nested_plan is None:
+            field_validator = get_field_validator(validator)
+        field_plans.append(FieldPlan(
+            name=dataclass_field.name,
+            input_key=input_field or dataclass_field.name,
+            validator=field_validator,
+            field_type=field_type,
+            type_mismatch=type_mismatch,
+            nested=nested_plan,
+            is_async=bool(field_validator) and is_async_validator(field_validator),
+            check_types=field_validator.check_types if field_validator else None,
+            init=dataclass_field.init,
+            path=dataclass_field.name,
+            collection=collection,
+        ))
+
+    nodes = [NodePlan(
+        cls=cls,
+        non_init_fields=tuple(field_plan.name for field_plan in field_plans if not field_plan.init),
+        frozen=cls.__dataclass_params__.frozen,
+    )]
+    leaves = []
+    _collect_tree(tuple(field_plans), 0, '', nodes, leaves)
+
+    routes = {}
+    for leaf in leaves:
+        routes.setdefault(leaf.input_key, []).append(leaf)
+    routes = {input_key: tuple(route_leaves) for input_key, route_leaves in routes.items()}
+
+    return ValidationPlan(
+        cls=cls,
+        fields=tuple(field_plans),
+        formatting_checks=tuple(formatting_checks),
+        nodes=tuple(nodes),
+        leaves=tuple(leaves),
+        routes=tuple(routes.items()),
+        async_fields=tuple(leaf.path for leaf in leaves if leaf.is_async),
+        routes_by_key=routes,
+    )
@@ -1,15 +1,40 @@
+import inspect
 from abc import ABC
 from typing import Type
 
-from rest_framework.exceptions import ValidationError
+import drf
+from errors import FieldError
 
 
 class ValidationExceptionGroup(ExceptionGroup):
     """Custom validation class for NonBlockingValidationDataclass class"""
 
 
+def is_async_validator(validator) -> bool:
+    """Validators with async def __call__ (or async def validate) do I/O, they are awaited concurrently by afrom_dict."""
+    if isinstance(validator, FieldValidator):
+        return inspect.iscoroutinefunction(validator.validate)
+    return inspect.iscoroutinefunction(validator.__call__)
+
+
 class AttrValidator(ABC):
+    """
+    Validator is instantiated with value and field name and called to validate the value.
+    __call__ can be declared async def for validators doing I/O (database, cache lookups):
+
+    class UniqueEmailValidator(AttrValidator):
+        type = str
+
+        async def __call__(self, *args, **kwargs):
+            super().__call__(self.type)
+            if await email_exists(self.value):
+                raise FieldError(self.field_name, 'invalid', self.value, {'message': 'Email is not unique'})
+
+    Validators whose result does not depend on the value only (clock, database) set cacheable = False,
+    see cache module.
+    """
     type: Type
+    cacheable = True
 
     def __init__(self, value, field_name: str):
         self.value = value
@@ -17,8 +42,7 @@ class AttrValidator(ABC):
 
     def __call__(self, type: Type, *args, **kwargs):
         if not isinstance(self.value, type):
-            raise ValidationError(f"Field: {self.field_name} raised ValidationError. "
-                                  f"Value: '{self.value}' is not of type: {type}")
+            raise FieldError(self.field_name, 'invalid_type', self.value, {'type': type})
 
 
 class BasicIntFieldValidator(AttrValidator):
@@ -40,3 +64,189 @@ class BasicStringFieldValidator(AttrValidator):
 
     def __call__(self, *args, **kwargs):
         super().__call__(self.type)
+
+
+class FieldValidator:
+    """
+    Reusable validator: configured once in field metadata and called for every value as validate(value, field_name).
+    Raises FieldError for invalid value, keeps no per call state so one instance is shared by all calls:
+
+    attr1: int = field(default=None, metadata={'validator': IntFieldValidator(nullable=True, min_value=0)})
+
+    Base class only checks the type, validators doing nothing more report it via check_types and
+    from_dict inlines the isinstance check instead of calling validate.
+    Non deterministic validators set class attribute cacheable = False.
+    """
+    __slots__ = ('type', 'nullable')
+    cacheable = True
+
+    def __init__(self, type: Type, nullable: bool = False):
+        self.type = type
+        self.nullable = nullable
+
+    def __repr__(self):
+        options = ', '.join(f'{name}={getattr(self, name)!r}' for name in self._get_option_names())
+        return f'{self.__class__.__name__}({options})'
+
+    @classmethod
+    def _get_option_names(cls):
+        return [name for klass in reversed(cls.__mro__) for name in getattr(klass, '__slots__', ())]
+
+    @property
+    def check_types(self):
+        """Types for isinstance if validation is a pure type check, None if validate does more."""
+        if type(self).validate is not FieldValidator.validate:
+            return None
+        return (self.type, type(None)) if self.nullable else (self.type,)
+
+    def type_error(self, value, field_name: str) -> FieldError:
+        return FieldError(field_name, 'invalid_type', value, {'type': self.type})
+
+    def validate(self, value, field_name: str):
+        if value is None and self.nullable:
+            return
+        if not isinstance(value, self.type):
+            raise self.type_error(value, field_name)
+
+
+class IntFieldValidator(FieldValidator):
+    __slots__ = ('min_value', 'max_value')
+
+    def __init__(self, nullable: bool = False, min_value: int = None, max_value: int = None):
+        super().__init__(int, nullable)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    @property
+    def check_types(self):
+        if type(self).validate is not IntFieldValidator.validate:
+            return None
+        if self.min_value is None and self.max_value is None:
+            return (int, type(None)) if self.nullable else (int,)
+        return None
+
+    def validate(self, value, field_name: str):
+        if value is None and self.nullable:
+            return
+        if not isinstance(value, int):
+            raise self.type_error(value, field_name)
+        if self.min_value is not None and value < self.min_value:
+            raise FieldError(field_name, 'min_value', value, {'min_value': self.min_value})
+        if self.max_value is not None and value > self.max_value:
+            raise FieldError(field_name, 'max_value', value, {'max_value': self.max_value})
+
+
+class FloatFieldValidator(FieldValidator):
+    __slots__ = ('min_value', 'max_value')
+
+    def __init__(self, nullable: bool = False, min_value: float = None, max_value: float = None):
+        super().__init__(float, nullable)
+        self.min_value = min_value
+        self.max_value = max_value
+
+    @property
+    def check_types(self):
+        if type(self).validate is not FloatFieldValidator.validate:
+            return None
+        if self.min_value is None and self.max_value is None:
+            return (float, type(None)) if self.nullable else (float,)
+        return None
+
+    def validate(self, value, field_name: str):
+        if value is None and self.nullable:
+            return
+        if not isinstance(value, float):
+            raise self.type_error(value, field_name)
+        if self.min_value is not None and value < self.min_value:
+            raise FieldError(field_name, 'min_value', value, {'min_value': self.min_value})
+        if self.max_value is not None and value > self.max_value:
+            raise FieldError(field_name, 'max_value', value, {'max_value': self.max_value})
+
+
+class StringFieldValidator(FieldValidator):
+    __slots__ = ('min_length', 'max_length')
+
+    def __init__(self, nullable: bool = False, min_length: int = None, max_length: int = None):
+        super().__init__(str, nullable)
+        self.min_length = min_length
+        self.max_length = max_length
+
+    @property
+    def check_types(self):
+        if type(self).validate is not StringFieldValidator.validate:
+            return None
+        if self.min_length is None and self.max_length is None:
+            return (str, type(None)) if self.nullable else (str,)
+        return None
+
+    def validate(self, value, field_name: str):
+        if value is None and self.nullable:
+            return
+        if not isinstance(value, str):
+            raise self.type_error(value, field_name)
+        if self.min_length is not None and len(value) < self.min_length:
+            raise FieldError(field_name, 'min_length', value, {'min_length': self.min_length})
+        if self.max_length is not None and len(value) > self.max_length:
+            raise FieldError(field_name, 'max_length', value, {'max_length': self.max_length})
+
+
+class DictFieldValidator(FieldValidator):
+    __slots__ = ()
+
+    def __init__(self, nullable: bool = False):
+        super().__init__(dict, nullable)
+
+
+class LegacyValidatorAdapter(FieldValidator):
+    """
+    Runs class based AttrValidator as validator_class(value, field_name)() behind validate protocol.
+    DRF ValidationError raised by older validators is converted to FieldError.
+    """
+    __slots__ = ('validator_class',)
+
+    def __init__(self, validator_class):
+        super().__init__(getattr(validator_class, 'type', None))
+        self.validator_class = validator_class
+
+    @property
+    def cacheable(self):
+        return getattr(self.validator_class, 'cacheable', True)
+
+    def validate(self, value, field_name: str):
+        try:
+            self.validator_class(value, field_name)()
+        except FieldError:
+            raise
+        except Exception as error:
+            if drf.is_drf_validation_error(error):
+                raise drf.from_drf_validation_error(error, field_name, value) from error
+            raise
+
+
+class AsyncLegacyValidatorAdapter(LegacyValidatorAdapter):
+    __slots__ = ()
+
+    async def validate(self, value, field_name: str):
+        try:
+            await self.validator_class(value, field_name)()
+        except FieldError:
+            raise
+        except Exception as error:
+            if drf.is_drf_validation_error(error):
+                raise drf.from_drf_validation_error(error, field_name, value) from error
+            raise
+
+
+# Class based validators doing only an isinstance check, replaced by a shared FieldValidator of the same type
+TYPE_CHECK_VALIDATORS = (BasicIntFieldValidator, BasicDictFieldValidator, BasicStringFieldValidator)
+
+
+def get_field_validator(validator) -> FieldValidator:
+    """FieldValidator for validator from field metadata, class based validators are adapted."""
+    if isinstance(validator, FieldValidator):
+        return validator
+    if validator in TYPE_CHECK_VALIDATORS:
+        return FieldValidator(validator.type)
+    if is_async_validator(validator):
+        return AsyncLegacyValidatorAdapter(validator)
+    return LegacyValidatorAdapter(validator)